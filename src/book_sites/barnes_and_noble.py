@@ -1,21 +1,106 @@
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+import asyncio
+import aiohttp
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
 import pandas as pd
 import time
+import csv
+import itertools
 import logging
 from urllib.parse import urljoin, quote_plus, urlparse
+from datetime import timedelta
 import re
 from typing import List, Dict, Optional
 import random
 import json
+from collections import OrderedDict
+from functools import lru_cache
+from dataclasses import dataclass, asdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Product pages are only read for the details table and product-details
+# section, so skip building the rest of the tree
+# base_url never changes, so repeated queries/hrefs hit these caches
+@lru_cache(maxsize=2048)
+def _encode_query(query: str) -> str:
+    return quote_plus(query)
+
+
+@lru_cache(maxsize=2048)
+def _join_url(base: str, path: str) -> str:
+    return urljoin(base, path)
+
+
+@dataclass(slots=True)
+class BookRecord:
+    """One scraped search result; slots keep per-record overhead low"""
+    Site: str = "Barnes & Noble"
+    Title: str = "Unknown Title"
+    Author: str = "Unknown Author"
+    Publisher: str = "Unknown Publisher"
+    Publication_Year: str = "Unknown"
+    ISBN: str = "N/A"
+    Price: str = "N/A"
+    Rating: str = "N/A"
+    URL: str = "N/A"
+    Format: str = "N/A"
+
+
+_DETAIL_STRAINER = SoupStrainer(
+    ['table', 'div'],
+    class_=re.compile(r'plain|centered|product-details|book-details')
+)
+
+# Compile the hot selectors once; soupsieve otherwise re-parses the CSS
+# pattern on every select() call
+_SEL_CONTAINERS = soupsieve.compile(
+    'div[class*=product-shelf-tile], div[class*=search-result], '
+    'div[data-testid*=product], div[data-testid*=book]'
+)
+_SEL_FIELDS = soupsieve.compile(
+    'div[class*=product-shelf-title], div[class*=product-shelf-author], '
+    'div[class*=product-shelf-pricing], span[class*=rating]'
+)
+
 class BarnesNobleBookScraper:
+    _DETAIL_CACHE_SIZE = 1024
+
+    # Patterns used on every container/row, compiled once at class scope
+    _RE_CONTAINER_CLS = re.compile(r'product-shelf-tile|search-result')
+    _RE_CONTAINER_TESTID = re.compile(r'product|book')
+    _RE_CONTAINER_GENERIC = re.compile(r'product|result|tile')
+    _RE_TITLE_DIV = re.compile(r'product-shelf-title')
+    _RE_TITLE_LINK = re.compile(r'title|product-title')
+    _RE_AUTHOR_DIV = re.compile(r'product-shelf-author')
+    _RE_AUTHOR_SPAN = re.compile(r'author|contributor')
+    _RE_PRICING_DIV = re.compile(r'product-shelf-pricing')
+    _RE_PRICE = re.compile(r'price|current-price')
+    _RE_DOLLAR = re.compile(r'\$\d')
+    _RE_RATING = re.compile(r'rating|stars')
+    _RE_BY_TEXT = re.compile(r'by\s+', re.I)
+    _RE_BY = re.compile(r'^(by\s+)', re.I)
+    _RE_YEAR = re.compile(r'\d{4}')
+    _RE_ISBN = re.compile(r'[\d-]{10,17}')
+    _RE_WS = re.compile(r'\s+')
+    _RE_DETAILS_DIV = re.compile(r'product-details|book-details')
+
     def __init__(self):
-        self.session = requests.Session()
+        # On-disk response cache so repeated runs reuse stored HTML instead
+        # of re-downloading; CachedSession mirrors the requests.Session API
+        self.session = requests_cache.CachedSession(
+            'bn_cache',
+            backend='sqlite',
+            expire_after=timedelta(hours=6),
+            allowable_codes=(200,),
+            cache_control=True,
+        )
         self.base_url = "https://www.barnesandnoble.com"
         self.search_url = "https://www.barnesandnoble.com/s/"
         self.user_agents = [
@@ -24,8 +109,24 @@ class BarnesNobleBookScraper:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15"
         ]
+        # LRU cache of parsed product-page details, keyed by normalized URL
+        self._detail_cache = OrderedDict()
+        self._last_request_ts = 0.0
+        self.setup_session()
         self.update_headers()
-    
+
+    def setup_session(self):
+        """Mount a pooled adapter so detail fetches reuse keep-alive connections"""
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=1.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET']),
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retry_strategy)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def update_headers(self):
         """Update headers with random user agent"""
         self.session.headers.update({
@@ -41,32 +142,134 @@ class BarnesNobleBookScraper:
             "Cache-Control": "max-age=0"
         })
         
-    def make_request_with_retry(self, url: str, max_retries: int = 3, timeout: int = 30) -> Optional[requests.Response]:
-        """Make HTTP request with retry logic and error handling"""
-        for attempt in range(max_retries):
-            try:
-                self.update_headers()
-                if attempt > 0:
-                    delay = random.uniform(3, 7)
-                    logger.info(f"Retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
-                    time.sleep(delay)
-                
-                response = self.session.get(url, timeout=timeout)
-                response.raise_for_status()
-                return response
-                
-            except requests.exceptions.Timeout:
-                logger.warning(f"Timeout on attempt {attempt + 1}/{max_retries}")
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"Request failed on attempt {attempt + 1}/{max_retries}: {str(e)}")
-        
+    _MIN_REQUEST_GAP = 0.5  # seconds between outbound requests
+    _READ_CHUNK = 65536
+    _MAX_CHUNKS = 32  # ~2MB cap; we only parse a few tables per page
+
+    def make_request_with_retry(self, url: str, timeout: int = 30) -> Optional[requests.Response]:
+        """Make HTTP request; retries and backoff are handled by the mounted adapter"""
+        try:
+            # Throttle at the request boundary instead of sleeping per container
+            wait = self._last_request_ts + self._MIN_REQUEST_GAP - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_ts = time.monotonic()
+            self.update_headers()
+            response = self.session.get(url, timeout=timeout, stream=True)
+            response.raise_for_status()
+            # Stream with a size cap instead of forcing the whole body into
+            # memory; product pages carry megabytes of inline JS we never parse
+            body = b''.join(
+                itertools.islice(response.iter_content(self._READ_CHUNK), self._MAX_CHUNKS)
+            )
+            response.close()  # Return the connection to the pool immediately
+            response._content = body
+            response._content_consumed = True
+            return response
+
+        except requests.exceptions.Timeout:
+            logger.warning(f"Timeout requesting {url}")
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Request failed for {url}: {str(e)}")
+
         return None
 
+    async def _fetch_page_async(self, session, semaphore, url: str, max_retries: int = 3, timeout: int = 15) -> Optional[bytes]:
+        """Fetch a single page with aiohttp, with retry logic and bounded concurrency"""
+        async with semaphore:
+            for attempt in range(max_retries):
+                try:
+                    if attempt > 0:
+                        delay = random.uniform(2, 5)
+                        logger.info(f"Async retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
+                        await asyncio.sleep(delay)
+
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        response.raise_for_status()
+                        return await response.read()
+
+                except asyncio.TimeoutError:
+                    logger.warning(f"Async timeout on attempt {attempt + 1}/{max_retries} for {url}")
+                except aiohttp.ClientError as e:
+                    logger.warning(f"Async request failed on attempt {attempt + 1}/{max_retries}: {str(e)}")
+
+            return None
+
+    async def _fetch_pages_async(self, urls: List[str], concurrency: int = 8) -> Dict[str, Optional[bytes]]:
+        """Fetch multiple pages concurrently with a per-host concurrency cap"""
+        semaphore = asyncio.Semaphore(concurrency)
+        headers = dict(self.session.headers)
+        async with aiohttp.ClientSession(headers=headers) as session:
+            pages = await asyncio.gather(
+                *[self._fetch_page_async(session, semaphore, url) for url in urls]
+            )
+        return dict(zip(urls, pages))
+
+    def _fetch_detail_pages(self, urls: List[str]) -> Dict[str, Dict]:
+        """Fetch and parse a batch of product pages concurrently, using cached results"""
+        details_by_url = {}
+        to_fetch = []
+        for url in dict.fromkeys(urls):  # De-duplicate, preserving order
+            cached = self._detail_cache_get(url)
+            if cached is not None:
+                details_by_url[url] = cached
+            else:
+                to_fetch.append(url)
+
+        if not to_fetch:
+            return details_by_url
+
+        # URLs with a stored HTTP response are served through the cached
+        # session (a SQLite read); only the rest go out over the network
+        uncached = []
+        for url in to_fetch:
+            if self.session.cache.contains(url=url):
+                details = self.get_book_details_from_page(url)
+                if details:
+                    details_by_url[url] = details
+            else:
+                uncached.append(url)
+
+        if not uncached:
+            return details_by_url
+
+        pages = asyncio.run(self._fetch_pages_async(uncached))
+
+        for url, html in pages.items():
+            if not html:
+                continue
+            details = self._parse_detail_page(BeautifulSoup(html, 'lxml', parse_only=_DETAIL_STRAINER))
+            if details:
+                details_by_url[url] = details
+                self._detail_cache_put(url, details)
+
+        return details_by_url
+
+    @staticmethod
+    def _normalize_detail_url(url: str) -> str:
+        """Normalize a product URL for cache lookups (drop query and fragment)"""
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+    def _detail_cache_get(self, url: str) -> Optional[Dict]:
+        key = self._normalize_detail_url(url)
+        details = self._detail_cache.get(key)
+        if details is not None:
+            self._detail_cache.move_to_end(key)
+        return details
+
+    def _detail_cache_put(self, url: str, details: Dict) -> None:
+        key = self._normalize_detail_url(url)
+        self._detail_cache[key] = details
+        self._detail_cache.move_to_end(key)
+        while len(self._detail_cache) > self._DETAIL_CACHE_SIZE:
+            self._detail_cache.popitem(last=False)
+
     def search_barnes_noble(self, book_query: str, max_results: int = 5) -> List[Dict]:
         """Search Barnes & Noble for books"""
         try:
             # Encode the search query
-            encoded_query = quote_plus(book_query)
+            encoded_query = _encode_query(book_query)
             search_url = f"{self.search_url}{encoded_query}"
             
             logger.info(f"Searching Barnes & Noble for: {book_query}")
@@ -77,40 +280,47 @@ class BarnesNobleBookScraper:
                 logger.error("Failed to get search results from Barnes & Noble")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             results = []
             
-            # Find book containers - Barnes & Noble uses different selectors
-            book_containers = soup.find_all('div', class_=re.compile(r'product-shelf-tile|search-result'))
-            
-            if not book_containers:
-                # Try alternative selectors
-                book_containers = soup.find_all('div', {'data-testid': re.compile(r'product|book')})
-            
+            # Find book containers - one union query covers the specific and
+            # fallback selectors in a single document traversal
+            book_containers = _SEL_CONTAINERS.select(soup)
+
             if not book_containers:
-                # Try more general selectors
-                book_containers = soup.find_all('div', class_=re.compile(r'product|result|tile'))
-            
+                # Last resort: the loosest class match, kept separate so it
+                # never outranks the structured selectors above
+                book_containers = soup.find_all('div', class_=self._RE_CONTAINER_GENERIC)
+
             logger.info(f"Found {len(book_containers)} book containers")
             
             count = 0
             for container in book_containers[:max_results * 2]:  # Get more to account for filtering
-                book_data = self.extract_book_details_bn(container, soup)
+                book_data = self.extract_book_details_bn(container, soup, fetch_details=False)
                 if book_data and count < max_results:
                     results.append(book_data)
                     count += 1
-                
-                # Add delay between extractions
-                time.sleep(random.uniform(1, 2))
-            
+
+            # Fetch all product pages concurrently instead of one per container
+            detail_urls = [book.URL for book in results if book.URL != "N/A"]
+            details_by_url = self._fetch_detail_pages(detail_urls)
+            for book_data in results:
+                detailed_info = details_by_url.get(book_data.URL)
+                if detailed_info:
+                    book_data.Publisher = self.clean_text(detailed_info.get('publisher', book_data.Publisher))
+                    book_data.Publication_Year = detailed_info.get('pub_year', book_data.Publication_Year)
+                    book_data.ISBN = detailed_info.get('isbn', book_data.ISBN)
+
             logger.info(f"Successfully extracted {len(results)} books from Barnes & Noble")
-            return results
+            # Callers (the Flask app, the savers) consume plain dicts, so
+            # convert at the public boundary only
+            return [asdict(book) for book in results]
             
         except Exception as e:
             logger.error(f"Error searching Barnes & Noble: {str(e)}")
             return []
     
-    def extract_book_details_bn(self, container, full_soup) -> Optional[Dict]:
+    def extract_book_details_bn(self, container, full_soup, fetch_details: bool = True) -> Optional[BookRecord]:
         """Extract book details from Barnes & Noble search result container"""
         try:
             # Initialize default values
@@ -124,52 +334,60 @@ class BarnesNobleBookScraper:
             rating = "N/A"
             format = "N/A"
             
+            # Grab every structured element in one traversal of the container,
+            # then dispatch on class instead of issuing a .find() per field.
+            title_div = None
+            author_div = None
+            pricing_div = None
+            rating_elem = None
+            for el in _SEL_FIELDS.iselect(container):
+                classes = ' '.join(el.get('class', []))
+                if title_div is None and 'product-shelf-title' in classes:
+                    title_div = el
+                elif author_div is None and 'product-shelf-author' in classes:
+                    author_div = el
+                elif pricing_div is None and 'product-shelf-pricing' in classes:
+                    pricing_div = el
+                elif rating_elem is None and el.name == 'span':
+                    rating_elem = el
+
             # Extract title
-            # Look for the specific div with class 'product-shelf-title'
-            title_div = container.find('div', class_=re.compile(r'product-shelf-title'))
             title_elem = None
             if title_div:
                 title_elem = title_div.find('a')
             if not title_elem:
-                # Fallback to previous logic
-                title_elem = container.find('h3') or container.find('a', class_=re.compile(r'title|product-title'))
+                # Fallback to the generic selectors only when the structured pass missed
+                title_elem = container.find('h3') or container.find('a', class_=self._RE_TITLE_LINK)
                 if not title_elem:
                     title_elem = container.find('a', {'data-testid': 'product-title'})
             if title_elem:
                 title = title_elem.get('title') or title_elem.get_text(strip=True)
                 # Get URL from title link
                 if title_elem.get('href'):
-                    book_url = urljoin(self.base_url, title_elem['href'])
-            
+                    book_url = _join_url(self.base_url, title_elem['href'])
+
             # Extract author
-            # Try to find the author in the 'product-shelf-author' div
-            author_div = container.find('div', class_=re.compile(r'product-shelf-author'))
             if author_div:
                 author_link = author_div.find('a')
                 if author_link:
                     author = author_link.get_text(strip=True)
                 else:
-                    # Fallback: get all text except the 'by' span
-                    author = ''.join(
-                        t for t in author_div.stripped_strings if t.lower() != 'by'
-                    )
+                    # Fallback: take the div's text in one call and strip the 'by' prefix
+                    author = self._RE_BY.sub('', author_div.get_text(' ', strip=True))
             else:
-                author_elem = container.find('span', class_=re.compile(r'author|contributor'))
+                author_elem = container.find('span', class_=self._RE_AUTHOR_SPAN)
                 if not author_elem:
                     author_elem = container.find('a', {'data-testid': 'author-link'})
                 if not author_elem:
                     # Look for "by" text
-                    by_elem = container.find(text=re.compile(r'by\s+', re.I))
+                    by_elem = container.find(text=self._RE_BY_TEXT)
                     if by_elem:
                         author_elem = by_elem.parent
                 if author_elem:
                     author = author_elem.get_text(strip=True)
-                    author = re.sub(r'^by\s+', '', author, flags=re.I)  # Remove "by" prefix
-            
+                    author = self._RE_BY.sub('', author)  # Remove "by" prefix
+
             # Extract price
-            price_elem = None
-            # Look for price in the new structure
-            pricing_div = container.find('div', class_=re.compile(r'product-shelf-pricing'))
             if pricing_div:
                 current_div = pricing_div.find('div', class_='current')
                 if current_div:
@@ -179,38 +397,37 @@ class BarnesNobleBookScraper:
                         price = spans[1].get_text(strip=True)
                     else:
                         # Fallback: look for a span with a $ sign
-                        price_span = current_div.find('span', string=re.compile(r'\$\d'))
+                        price_span = current_div.find('span', string=self._RE_DOLLAR)
                         if price_span:
                             price = price_span.get_text(strip=True)
             if price == "N/A":
                 # Fallback to previous logic
-                price_elem = container.find('span', class_=re.compile(r'price|current-price'))
+                price_elem = container.find('span', class_=self._RE_PRICE)
                 if not price_elem:
                     price_elem = container.find('div', {'data-testid': 'price'})
                 if price_elem:
                     price = price_elem.get_text(strip=True)
-            
+
             # Extract rating
-            rating_elem = container.find('span', class_=re.compile(r'rating|stars'))
             if rating_elem:
                 rating = rating_elem.get_text(strip=True)
 
-            # Extract format
-            pricing_elem = container.find('div', class_='product-shelf-pricing mt-xs')
-            if pricing_elem:
-                format_elem = pricing_elem.find('span', class_='format')
+            # Extract format from the pricing div already found above
+            if pricing_div:
+                format_elem = pricing_div.find('span', class_='format')
                 if format_elem:
                     format = format_elem.get_text(strip=True)
                     
             
             # If we have a book URL, try to get more details from the product page
-            if book_url != "N/A":
+            # (skipped when the caller batches the detail fetches itself)
+            if fetch_details and book_url != "N/A":
                 detailed_info = self.get_book_details_from_page(book_url)
                 if detailed_info:
                     publisher = detailed_info.get('publisher', publisher)
                     pub_year = detailed_info.get('pub_year', pub_year)
                     isbn = detailed_info.get('isbn', isbn)
-            
+
             # Clean up extracted data
             title = self.clean_text(title)
             author = self.clean_text(author)
@@ -220,18 +437,17 @@ class BarnesNobleBookScraper:
             if title == "Unknown Title" and author == "Unknown Author":
                 return None
             
-            return {
-                "Site": "Barnes & Noble",
-                "Title": title,
-                "Author": author,
-                "Publisher": publisher,
-                "Publication_Year": pub_year,
-                "ISBN": isbn,
-                "Price": price,
-                "Rating": rating,
-                "URL": book_url,
-                "Format": format,
-            }
+            return BookRecord(
+                Title=title,
+                Author=author,
+                Publisher=publisher,
+                Publication_Year=pub_year,
+                ISBN=isbn,
+                Price=price,
+                Rating=rating,
+                URL=book_url,
+                Format=format,
+            )
             
         except Exception as e:
             logger.error(f"Error extracting Barnes & Noble book details: {str(e)}")
@@ -240,60 +456,53 @@ class BarnesNobleBookScraper:
     def get_book_details_from_page(self, book_url: str) -> Optional[Dict]:
         """Get additional book details from individual product page"""
         try:
+            cached = self._detail_cache_get(book_url)
+            if cached is not None:
+                return cached
+
             response = self.make_request_with_retry(book_url, timeout=15)
             if not response:
                 return None
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+
+            details = self._parse_detail_page(BeautifulSoup(response.content, 'lxml', parse_only=_DETAIL_STRAINER))
+            if details:
+                self._detail_cache_put(book_url, details)
+            return details
+
+        except Exception as e:
+            logger.error(f"Error getting book details from page {book_url}: {str(e)}")
+            return None
+
+    def _parse_detail_page(self, soup) -> Optional[Dict]:
+        """Extract publisher/publication date/ISBN details from a parsed product page"""
+        try:
             details = {}
-            
-            # Look for publisher information in the details table
+
+            # Walk the details table once, picking up publisher, publication
+            # date and ISBN-13 from a single pass over the rows
             pub_table = soup.find('table', class_='plain centered')
             if pub_table:
-                rows = pub_table.find_all('tr')
-                for row in rows:
+                for row in pub_table.find_all('tr'):
                     th = row.find('th')
                     td = row.find('td')
-                    if th and td and 'publisher' in th.get_text(strip=True).lower():
+                    if not (th and td):
+                        continue
+                    th_text = th.get_text(strip=True).lower()
+                    if 'publisher' in th_text and 'publisher' not in details:
                         # Try to get publisher from <span itemprop="publisher"> if present
                         span = td.find('span', attrs={'itemprop': 'publisher'})
-                        if span:
-                            details['publisher'] = span.get_text(strip=True)
-                        else:
-                            details['publisher'] = td.get_text(strip=True)
-                        break
-            
-            # Look for publication date in the details table
-            if pub_table:
-                rows = pub_table.find_all('tr')
-                for row in rows:
-                    th = row.find('th')
-                    td = row.find('td')
-                    if th and td:
-                        th_text = th.get_text(strip=True).lower()
-                        if 'publication date' in th_text:
-                            pub_date = td.get_text(strip=True)
-                            # Extract year from date
-                            year_match = re.search(r'\d{4}', pub_date)
-                            if year_match:
-                                details['pub_year'] = year_match.group()
-                            break
-            
-            # Look for ISBN-13 in the details table
-            if pub_table:
-                rows = pub_table.find_all('tr')
-                for row in rows:
-                    th = row.find('th')
-                    td = row.find('td')
-                    if th and td and 'isbn-13' in th.get_text(strip=True).lower():
-                        isbn_text = td.get_text(strip=True)
-                        isbn_match = re.search(r'[\d-]{10,17}', isbn_text)
+                        details['publisher'] = (span or td).get_text(strip=True)
+                    elif 'publication date' in th_text and 'pub_year' not in details:
+                        year_match = self._RE_YEAR.search(td.get_text(strip=True))
+                        if year_match:
+                            details['pub_year'] = year_match.group()
+                    elif 'isbn-13' in th_text and 'isbn' not in details:
+                        isbn_match = self._RE_ISBN.search(td.get_text(strip=True))
                         if isbn_match:
                             details['isbn'] = isbn_match.group()
-                        break
             
             # Try alternative method - look in product details section
-            product_details = soup.find('div', class_=re.compile(r'product-details|book-details'))
+            product_details = soup.find('div', class_=self._RE_DETAILS_DIV)
             if product_details:
                 # Look for structured data
                 for dt in product_details.find_all('dt'):
@@ -304,30 +513,30 @@ class BarnesNobleBookScraper:
                         if 'publisher' in dt_text:
                             details['publisher'] = dd_text
                         elif 'publication' in dt_text or 'publish' in dt_text:
-                            year_match = re.search(r'\d{4}', dd_text)
+                            year_match = self._RE_YEAR.search(dd_text)
                             if year_match:
                                 details['pub_year'] = year_match.group()
                         elif 'isbn' in dt_text:
-                            isbn_match = re.search(r'[\d-]{10,17}', dd_text)
+                            isbn_match = self._RE_ISBN.search(dd_text)
                             if isbn_match:
                                 details['isbn'] = isbn_match.group()
             
             return details
-            
+
         except Exception as e:
-            logger.error(f"Error getting book details from page {book_url}: {str(e)}")
+            logger.error(f"Error parsing book details page: {str(e)}")
             return None
-    
+
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
         if not text:
             return "Unknown"
         
         # Remove extra whitespace and newlines
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = self._RE_WS.sub(' ', text).strip()
         
         # Remove common prefixes
-        text = re.sub(r'^(by\s+)', '', text, flags=re.I)
+        text = self._RE_BY.sub('', text)
         
         return text if text else "Unknown"
     
@@ -340,17 +549,33 @@ class BarnesNobleBookScraper:
         query = f"{title} {author}".strip()
         return self.search_barnes_noble(query)
 
-    def save_to_excel(self, data: List[Dict], filename: str = "barnes_noble_books.xlsx") -> None:
-        """Save book data to Excel"""
-        if not data:
+    async def _guarded_search(self, semaphore, query: str, max_results: int) -> List[Dict]:
+        """Run one blocking search in a worker thread, bounded by the semaphore"""
+        async with semaphore:
+            return await asyncio.to_thread(self.search_barnes_noble, query, max_results)
+
+    async def search_many(self, queries: List[str], max_results: int = 5, concurrency: int = 8) -> List[List[Dict]]:
+        """Search multiple queries concurrently; returns one result list per query"""
+        semaphore = asyncio.Semaphore(concurrency)
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._guarded_search(semaphore, query, max_results))
+                for query in queries
+            ]
+        return [task.result() for task in tasks]
+
+    def save_to_excel(self, data, filename: str = "barnes_noble_books.xlsx") -> None:
+        """Save book data to Excel; accepts a list of dicts or a prebuilt DataFrame"""
+        # Accepting a DataFrame lets callers accumulate batches via pd.concat
+        # across searches instead of rebuilding from records every run
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        if df.empty:
             logger.warning("No data to save")
             return
-        
-        df = pd.DataFrame(data)
-        #df["Date_Scraped"] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
-        
+
         try:
-            df.to_excel(filename, index=False)
+            # xlsxwriter is much faster than openpyxl for flat write-only sheets
+            df.to_excel(filename, index=False, engine='xlsxwriter')
             logger.info(f"Data saved to {filename}")
             logger.info(f"Total books found: {len(df)}")
             
@@ -368,16 +593,17 @@ class BarnesNobleBookScraper:
             logger.error(f"Error saving to Excel: {str(e)}")
 
     def save_to_csv(self, data: List[Dict], filename: str = "barnes_noble_books.csv") -> None:
-        """Save book data to CSV"""
+        """Save book data to CSV, streaming one row at a time"""
         if not data:
             logger.warning("No data to save")
             return
-        
-        df = pd.DataFrame(data)
-        #df["Date_Scraped"] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
-        
+
         try:
-            df.to_csv(filename, index=False)
+            # csv.DictWriter streams rows without building a DataFrame first
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(data[0].keys()), extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(data)
             logger.info(f"Data saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving to CSV: {str(e)}")
@@ -393,15 +619,12 @@ if __name__ == "__main__":
     ]
     
     all_results = []
-    
-    for query in search_queries:
-        print(f"\nSearching for: {query}")
-        results = scraper.search_barnes_noble(query, max_results=1)
+
+    # Run the queries concurrently instead of one per loop iteration
+    for query, results in zip(search_queries, asyncio.run(scraper.search_many(search_queries, max_results=1))):
+        print(f"\nSearched for: {query} ({len(results)} results)")
         all_results.extend(results)
-        
-        # Add delay between searches
-        time.sleep(random.uniform(2, 4))
-    
+
     # Save results
     if all_results:
         scraper.save_to_excel(all_results)
@@ -1,10 +1,17 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import asyncio
+import aiohttp
+import csv
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer
+from openpyxl import Workbook
 import time
+import itertools
+from datetime import datetime
 import logging
-from urllib.parse import urljoin, quote_plus
+from urllib.parse import urljoin, quote_plus, urlsplit, urlunsplit
 import re
+import soupsieve
 from typing import List, Dict, Optional
 import random
 import json
@@ -15,24 +22,144 @@ from urllib3.util.retry import Retry
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Patterns used per container per field, compiled once at import
+_RE_BY = re.compile(r'^by\s+', re.I)
+_RE_PRICE = re.compile(r'\$[\d.,]+')
+_RE_YEAR = re.compile(r'\d{4}')
+_RE_ISBN = re.compile(r'[\d-]{10,17}')
+_RE_WS = re.compile(r'\s+')
+
+# Microdata fast paths tried on the raw bytes before any DOM parse; the
+# product pages mark these fields up with stable itemprop attributes
+_RE_RAW_PUBLISHER = re.compile(rb'itemprop="publisher"[^>]*>([^<]+)<')
+_RE_RAW_PUB_DATE = re.compile(rb'itemprop="datePublished"[^>]*>([^<]+)<')
+_RE_RAW_ISBN = re.compile(rb'itemprop="isbn"[^>]*>([^<]+)<')
+
+# Module-level tuple: random.choice indexes it directly and nothing
+# rebuilds the list per instance
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# Everything except the rotated User-Agent is fixed for the session
+STATIC_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+    "DNT": "1",
+    "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    "Sec-Ch-Ua-Mobile": "?0",
+    "Sec-Ch-Ua-Platform": '"Windows"'
+}
+
+# Only the result/product blocks are ever queried, so skip building the
+# navigation, scripts and footer into the tree
+_SEARCH_CLASS = re.compile(r'product|search|result|book')
+_SEARCH_HREF = re.compile(r'/product|/book|/item')
+
+
+def _search_match(name, attrs):
+    """Keep result containers by class or data-testid, and product links by href"""
+    if name == 'a':
+        return bool(_SEARCH_HREF.search(attrs.get('href', '')))
+    if name in ('div', 'section', 'ul'):
+        classes = attrs.get('class', '')
+        if not isinstance(classes, str):
+            classes = ' '.join(classes)
+        if classes and _SEARCH_CLASS.search(classes):
+            return True
+        return attrs.get('data-testid', '') == 'product'
+    return False
+
+
+_SEARCH_STRAINER = SoupStrainer(_search_match)
+_DETAIL_CLASS = re.compile(r'product|publisher|publication|pub-|isbn|book')
+_DETAIL_ITEMPROP = re.compile(r'publisher|datePublished|isbn')
+
+
+def _detail_match(name, attrs):
+    """Keep elements whose class or itemprop can carry a detail field"""
+    if name not in ('div', 'section', 'span'):
+        return False
+    classes = attrs.get('class', '')
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    return bool(_DETAIL_CLASS.search(classes)
+                or _DETAIL_ITEMPROP.search(attrs.get('itemprop', '')))
+
+
+_DETAIL_STRAINER = SoupStrainer(_detail_match)
+
+class _TokenBucket:
+    """Token-bucket limiter: bursts run at full speed, sustained traffic
+    is paced at `rate` requests per second"""
+
+    def __init__(self, rate: float = 1.0, burst: int = 5):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            self.tokens = 0.0
+        else:
+            self.tokens -= 1
+
+
 class BetterWorldBooksScraper:
+    # Candidate selectors per field, merged so each extraction is a single
+    # tree traversal, and precompiled so select() stops re-parsing the CSS
+    _CONTAINER_SEL = soupsieve.compile(
+        '.product-item, .book-item, .search-result, .product, .book, '
+        '[data-testid="product"], .result-item'
+    )
+    _TITLE_SEL = soupsieve.compile('.product-title, .book-title, h2 a, h3 a, .title, [data-testid="title"], a[title]')
+    _URL_SEL = soupsieve.compile('a[href*="/product"], a[href*="/book"], a[href*="/item"]')
+    _AUTHOR_SEL = soupsieve.compile('.author, .product-author, .by-author, [data-testid="author"]')
+    _PRICE_SEL = soupsieve.compile('.price, .product-price, .cost, [data-testid="price"]')
+    _FORMAT_SEL = soupsieve.compile('.format, .binding, .book-format, [data-testid="format"]')
+    _PUBLISHER_SEL = soupsieve.compile('.publisher, [itemprop="publisher"], .pub-info')
+    _PUB_DATE_SEL = soupsieve.compile('.publication-date, [itemprop="datePublished"], .pub-date')
+    _ISBN_SEL = soupsieve.compile('.isbn, [itemprop="isbn"], .product-isbn')
+
     def __init__(self):
         self.session = requests.Session()
         self.base_url = "https://www.betterworldbooks.com"
+        self._base_url_no_slash = self.base_url.rstrip('/')
         self.search_url = "https://www.betterworldbooks.com/search/results"
         
-        # More comprehensive user agents
-        self.user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/119.0",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.6 Safari/605.1.15",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
+        # Gate the debug-HTML dump; it is sizeable synchronous disk I/O
+        self.debug = False
+        
+        # Parsed detail pages keyed by canonical URL; format variants of the
+        # same edition often share one detail URL
+        self._detail_cache = {}
+        
+        # Paces outbound requests; replaces the scattered random sleeps
+        self._limiter = _TokenBucket(rate=1.0, burst=5)
         
         # Setup session with retry strategy
         self.setup_session()
+        # Static headers go on once; only the User-Agent rotates per request
+        self.session.headers.update(STATIC_HEADERS)
         self.update_headers()
 
     def setup_session(self):
@@ -42,30 +169,20 @@ class BetterWorldBooksScraper:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Larger pools keep the TLS connection alive across the search page
+        # and the concurrent detail fetches instead of re-handshaking
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=32,
+            pool_maxsize=64,
+            pool_block=False,
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
 
     def update_headers(self):
-        """Update headers with random user agent and realistic browser headers"""
-        self.headers = {
-            "User-Agent": random.choice(self.user_agents),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-            "Sec-Fetch-Dest": "document",
-            "Sec-Fetch-Mode": "navigate",
-            "Sec-Fetch-Site": "none",
-            "Sec-Fetch-User": "?1",
-            "Cache-Control": "max-age=0",
-            "DNT": "1",
-            "Sec-Ch-Ua": '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"Windows"'
-        }
-        self.session.headers.update(self.headers)
+        """Rotate only the User-Agent; the rest of the headers are static"""
+        self.session.headers['User-Agent'] = random.choice(USER_AGENTS)
 
     def get_initial_session(self):
         """Visit homepage first to establish session"""
@@ -75,8 +192,6 @@ class BetterWorldBooksScraper:
             response = self.session.get(self.base_url, timeout=15)
             if response.status_code == 200:
                 logger.info("Initial session established successfully")
-                # Add random delay
-                time.sleep(random.uniform(2, 4))
                 return True
             else:
                 logger.warning(f"Initial session returned status code: {response.status_code}")
@@ -85,6 +200,9 @@ class BetterWorldBooksScraper:
             logger.error(f"Failed to establish initial session: {str(e)}")
             return False
 
+    _READ_CHUNK = 65536
+    _MAX_CHUNKS = 32  # ~2MB cap; we only read a handful of fields per page
+
     def make_request_with_retry(self, url: str, max_retries: int = 3, timeout: int = 30) -> Optional[requests.Response]:
         """Make HTTP request with retry logic and error handling"""
         for attempt in range(max_retries):
@@ -97,19 +215,32 @@ class BetterWorldBooksScraper:
                     logger.info(f"Retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
                     time.sleep(delay)
                 
-                # Add random delay before each request
-                time.sleep(random.uniform(1, 3))
+                # Pacing: only blocks once the burst budget is spent
+                self._limiter.acquire()
                 
-                response = self.session.get(url, timeout=timeout)
+                response = self.session.get(url, timeout=timeout, stream=True)
                 
                 if response.status_code == 403:
                     logger.warning(f"403 Forbidden on attempt {attempt + 1}/{max_retries}")
+                    retry_after = response.headers.get('Retry-After')
+                    response.close()
+                    if retry_after and retry_after.isdigit():
+                        # The server told us how long to back off; honor it
+                        time.sleep(min(int(retry_after), 60))
                     if attempt < max_retries - 1:
                         # Try to re-establish session
                         self.get_initial_session()
                     continue
                 
                 response.raise_for_status()
+                # Stream with a size cap rather than buffering the whole body;
+                # product pages carry inline JS/CSS the parsers never look at
+                body = b''.join(
+                    itertools.islice(response.iter_content(self._READ_CHUNK), self._MAX_CHUNKS)
+                )
+                response.close()  # Hand the connection back to the pool
+                response._content = body
+                response._content_consumed = True
                 return response
                 
             except requests.exceptions.Timeout:
@@ -123,6 +254,70 @@ class BetterWorldBooksScraper:
         
         return None
 
+    async def _fetch_page_async(self, session, url: str, max_retries: int = 3, timeout: int = 15) -> Optional[bytes]:
+        """Fetch a single page with aiohttp, retrying with backoff"""
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    delay = random.uniform(2, 5)
+                    logger.info(f"Async retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
+                    await asyncio.sleep(delay)
+
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    response.raise_for_status()
+                    return await response.read()
+
+            except asyncio.TimeoutError:
+                logger.warning(f"Async timeout on attempt {attempt + 1}/{max_retries} for {url}")
+            except aiohttp.ClientError as e:
+                logger.warning(f"Async request failed on attempt {attempt + 1}/{max_retries}: {str(e)}")
+
+        return None
+
+    async def _fetch_pages_async(self, urls: List[str]) -> Dict[str, Optional[bytes]]:
+        """Fetch multiple pages concurrently with a per-host connection cap"""
+        connector = aiohttp.TCPConnector(limit_per_host=8)
+        async with aiohttp.ClientSession(connector=connector, headers=dict(self.session.headers)) as session:
+            pages = await asyncio.gather(
+                *[self._fetch_page_async(session, url) for url in urls]
+            )
+        return dict(zip(urls, pages))
+
+    def _fetch_detail_pages(self, urls: List[str]) -> Dict[str, Dict]:
+        """Fetch and parse a batch of product pages concurrently"""
+        details_by_url = {}
+        to_fetch = []
+        for url in dict.fromkeys(urls):  # De-duplicate, preserving order
+            cached = self._detail_cache.get(self._canonical_url(url))
+            if cached is not None:
+                details_by_url[url] = cached
+            else:
+                to_fetch.append(url)
+        urls = to_fetch
+        if not urls:
+            return details_by_url
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Already inside an event loop (e.g. called from async code):
+            # asyncio.run would blow up, so fan out over threads instead.
+            # The session is thread-safe for GETs and shares the adapter pool.
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                details_by_url.update(zip(urls, executor.map(self.get_book_details_from_page, urls)))
+                return details_by_url
+
+        pages = asyncio.run(self._fetch_pages_async(urls))
+        for url, html in pages.items():
+            if html:
+                soup = BeautifulSoup(html, 'lxml', parse_only=_DETAIL_STRAINER)
+                details = self._parse_detail_page(soup, url)
+                details_by_url[url] = details
+                self._detail_cache[self._canonical_url(url)] = details
+        return details_by_url
+
     def search_better_world_books(self, book_query: str, max_results: int = 5) -> List[Dict]:
         """Search Better World Books for books"""
         try:
@@ -146,34 +341,20 @@ class BetterWorldBooksScraper:
                 response = self.make_request_with_retry(search_url, timeout=15)
                 if response:
                     break
-                time.sleep(random.uniform(2, 4))
             
             if not response:
                 logger.error("Failed to get search results from Better World Books")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_SEARCH_STRAINER)
             results = []
             
-            # Try multiple selectors for book containers
-            selectors = [
-                '.product-item',
-                '.book-item', 
-                '.search-result',
-                '.product',
-                '.book',
-                '[data-testid="product"]',
-                '.result-item'
-            ]
-            
-            book_containers = []
-            for selector in selectors:
-                containers = soup.select(selector)
-                if containers:
-                    book_containers = containers
-                    logger.info(f"Found {len(containers)} containers with selector: {selector}")
-                    break
-            
+            # One union query finds the containers in a single DOM walk
+            # instead of re-traversing the tree once per candidate selector
+            book_containers = self._CONTAINER_SEL.select(soup)
+            if book_containers:
+                logger.info(f"Found {len(book_containers)} book containers")
+
             if not book_containers:
                 logger.warning("No book containers found. Trying alternative approach...")
                 # Try to find any links that might be book results
@@ -183,21 +364,30 @@ class BetterWorldBooksScraper:
             
             if not book_containers:
                 logger.warning("No book containers found. Page structure may have changed.")
-                # Save HTML for debugging
-                with open('debug_page.html', 'w', encoding='utf-8') as f:
-                    f.write(response.text)
-                logger.info("Saved page HTML to debug_page.html for inspection")
+                if self.debug:
+                    # Timestamped name so concurrent runs don't clobber each other
+                    debug_file = f"debug_page_{datetime.now():%Y%m%d_%H%M%S}.html"
+                    with open(debug_file, 'w', encoding='utf-8') as f:
+                        f.write(response.text)
+                    logger.info(f"Saved page HTML to {debug_file} for inspection")
                 return []
             
             count = 0
             for container in book_containers[:max_results * 2]:
-                book_data = self.extract_book_details(container)
+                book_data = self.extract_book_details(container, fetch_details=False)
                 if book_data and count < max_results:
                     results.append(book_data)
                     count += 1
-                
-                # Random delay between extractions
-                time.sleep(random.uniform(0.5, 2))
+            
+            # Fetch all detail pages concurrently instead of one per container
+            detail_urls = [book['URL'] for book in results if book['URL'] != "N/A"]
+            details_by_url = self._fetch_detail_pages(detail_urls)
+            for book_data in results:
+                additional_details = details_by_url.get(book_data['URL'])
+                if additional_details:
+                    book_data['Publisher'] = additional_details.get('publisher', book_data['Publisher'])
+                    book_data['Publication_Year'] = additional_details.get('pub_year', book_data['Publication_Year'])
+                    book_data['ISBN'] = additional_details.get('isbn', book_data['ISBN'])
             
             return results
             
@@ -205,7 +395,7 @@ class BetterWorldBooksScraper:
             logger.error(f"Error searching Better World Books: {str(e)}")
             return []
 
-    def extract_book_details(self, container) -> Optional[Dict]:
+    def extract_book_details(self, container, fetch_details: bool = True) -> Optional[Dict]:
         """Extract book details from search result container"""
         try:
             # Extract basic information with multiple selector attempts
@@ -216,9 +406,9 @@ class BetterWorldBooksScraper:
             format_info = self.extract_format(container)
             
             # Get additional details from product page if URL available
+            # (skipped when the caller batches the detail fetches itself)
             additional_details = {}
-            if book_url and book_url != "N/A":
-                time.sleep(random.uniform(1, 3))  # Delay before detail page request
+            if fetch_details and book_url and book_url != "N/A":
                 additional_details = self.get_book_details_from_page(book_url)
             
             # Combine all details
@@ -241,138 +431,128 @@ class BetterWorldBooksScraper:
             return None
 
     def extract_title(self, container) -> str:
-        """Extract book title with multiple selector attempts"""
-        selectors = [
-            '.product-title',
-            '.book-title',
-            'h2 a',
-            'h3 a',
-            '.title',
-            '[data-testid="title"]',
-            'a[title]'
-        ]
-        
-        for selector in selectors:
-            title_elem = container.select_one(selector)
-            if title_elem:
-                title = title_elem.get('title') or title_elem.get_text(strip=True)
-                if title and len(title) > 3:
-                    return self.clean_text(title)
+        """Extract book title from the merged candidate selectors"""
+        for title_elem in self._TITLE_SEL.iselect(container):
+            title = title_elem.get('title') or title_elem.get_text(strip=True)
+            if title and len(title) > 3:
+                return self.clean_text(title)
         
         return "Unknown Title"
 
     def extract_url(self, container) -> str:
-        """Extract book URL with multiple selector attempts"""
-        selectors = [
-            'a[href*="/product"]',
-            'a[href*="/book"]',
-            'a[href*="/item"]',
-            'a[href]'
-        ]
-        
-        for selector in selectors:
-            url_elem = container.select_one(selector)
-            if url_elem and url_elem.get('href'):
-                href = url_elem['href']
-                if '/product' in href or '/book' in href or '/item' in href:
-                    return urljoin(self.base_url, href)
+        """Extract book URL from the merged candidate selectors"""
+        url_elem = next(self._URL_SEL.iselect(container), None)
+        if url_elem and url_elem.get('href'):
+            href = url_elem['href']
+            # urljoin parses both URLs; the common cases don't need that
+            if href.startswith('http'):
+                return href
+            if href.startswith('/'):
+                return self._base_url_no_slash + href
+            return urljoin(self.base_url, href)
         
         return "N/A"
 
     def extract_author(self, container) -> str:
-        """Extract author name with multiple selector attempts"""
-        selectors = [
-            '.author',
-            '.product-author',
-            '.by-author',
-            '[data-testid="author"]'
-        ]
-        
-        for selector in selectors:
-            author_elem = container.select_one(selector)
-            if author_elem:
-                author = author_elem.get_text(strip=True)
-                author = re.sub(r'^by\s+', '', author, flags=re.I)
-                if author and len(author) > 2:
-                    return self.clean_text(author)
+        """Extract author name from the merged candidate selectors"""
+        for author_elem in self._AUTHOR_SEL.iselect(container):
+            author = author_elem.get_text(strip=True)
+            author = _RE_BY.sub('', author)
+            if author and len(author) > 2:
+                return self.clean_text(author)
         
         return "Unknown Author"
 
     def extract_price(self, container) -> str:
-        """Extract book price with multiple selector attempts"""
-        selectors = [
-            '.price',
-            '.product-price',
-            '.cost',
-            '[data-testid="price"]'
-        ]
-        
-        for selector in selectors:
-            price_elem = container.select_one(selector)
-            if price_elem:
-                price_text = price_elem.get_text()
-                price_match = re.search(r'\$[\d.,]+', price_text)
-                if price_match:
-                    return price_match.group(0)
+        """Extract book price from the merged candidate selectors"""
+        for price_elem in self._PRICE_SEL.iselect(container):
+            price_match = _RE_PRICE.search(price_elem.get_text())
+            if price_match:
+                return price_match.group(0)
         
         return "N/A"
 
     def extract_format(self, container) -> str:
-        """Extract book format with multiple selector attempts"""
-        selectors = [
-            '.format',
-            '.binding',
-            '.book-format',
-            '[data-testid="format"]'
-        ]
-        
-        for selector in selectors:
-            format_elem = container.select_one(selector)
-            if format_elem:
-                format_text = format_elem.get_text(strip=True)
-                if format_text and len(format_text) > 1:
-                    return self.clean_text(format_text)
+        """Extract book format from the merged candidate selectors"""
+        for format_elem in self._FORMAT_SEL.iselect(container):
+            format_text = format_elem.get_text(strip=True)
+            if format_text and len(format_text) > 1:
+                return self.clean_text(format_text)
         
         return "N/A"
 
+    @staticmethod
+    def _canonical_url(url: str) -> str:
+        """Normalize a detail URL for cache lookups"""
+        scheme, netloc, path, _, _ = urlsplit(url)
+        return urlunsplit((scheme, netloc, path.rstrip('/'), '', ''))
+
     def get_book_details_from_page(self, book_url: str) -> Dict:
         """Get additional book details from product page"""
-        try:
-            response = self.make_request_with_retry(book_url, timeout=20)
-            if not response:
-                return {}
+        cache_key = self._canonical_url(book_url)
+        cached = self._detail_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        response = self.make_request_with_retry(book_url, timeout=20)
+        if not response:
+            return {}
+
+        # Try the microdata byte-regexes first; a full parse only happens
+        # when the page doesn't carry the itemprop markup
+        details = self._extract_details_raw(response.content)
+        if not details:
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_DETAIL_STRAINER)
+            details = self._parse_detail_page(soup, book_url)
+        self._detail_cache[cache_key] = details
+        return details
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+    def _extract_details_raw(self, content: bytes) -> Dict:
+        """Pull the microdata fields straight off the raw HTML bytes"""
+        details = {}
+        
+        publisher_match = _RE_RAW_PUBLISHER.search(content)
+        if publisher_match:
+            details['publisher'] = self.clean_text(
+                publisher_match.group(1).decode('utf-8', 'replace'))
+        
+        pub_date_match = _RE_RAW_PUB_DATE.search(content)
+        if pub_date_match:
+            year_match = _RE_YEAR.search(pub_date_match.group(1).decode('utf-8', 'replace'))
+            if year_match:
+                details['pub_year'] = year_match.group()
+        
+        isbn_match = _RE_RAW_ISBN.search(content)
+        if isbn_match:
+            digits = _RE_ISBN.search(isbn_match.group(1).decode('utf-8', 'replace'))
+            if digits:
+                details['isbn'] = digits.group()
+        
+        return details
+
+    def _parse_detail_page(self, soup, book_url: str) -> Dict:
+        """Pull publisher, publication year and ISBN out of a parsed product page"""
+        try:
             details = {}
 
-            # Extract publisher with multiple selectors
-            publisher_selectors = ['.publisher', '[itemprop="publisher"]', '.pub-info']
-            for selector in publisher_selectors:
-                publisher_elem = soup.select_one(selector)
-                if publisher_elem:
-                    details['publisher'] = self.clean_text(publisher_elem.get_text())
-                    break
+            # Extract publisher
+            publisher_elem = next(self._PUBLISHER_SEL.iselect(soup), None)
+            if publisher_elem:
+                details['publisher'] = self.clean_text(publisher_elem.get_text())
 
             # Extract publication year
-            date_selectors = ['.publication-date', '[itemprop="datePublished"]', '.pub-date']
-            for selector in date_selectors:
-                pub_date_elem = soup.select_one(selector)
-                if pub_date_elem:
-                    year_match = re.search(r'\d{4}', pub_date_elem.get_text())
-                    if year_match:
-                        details['pub_year'] = year_match.group()
-                        break
+            for pub_date_elem in self._PUB_DATE_SEL.iselect(soup):
+                year_match = _RE_YEAR.search(pub_date_elem.get_text())
+                if year_match:
+                    details['pub_year'] = year_match.group()
+                    break
 
             # Extract ISBN
-            isbn_selectors = ['.isbn', '[itemprop="isbn"]', '.product-isbn']
-            for selector in isbn_selectors:
-                isbn_elem = soup.select_one(selector)
-                if isbn_elem:
-                    isbn = isbn_elem.get_text(strip=True)
-                    isbn_match = re.search(r'[\d-]{10,17}', isbn)
-                    if isbn_match:
-                        details['isbn'] = isbn_match.group()
-                        break
+            for isbn_elem in self._ISBN_SEL.iselect(soup):
+                isbn_match = _RE_ISBN.search(isbn_elem.get_text(strip=True))
+                if isbn_match:
+                    details['isbn'] = isbn_match.group()
+                    break
 
             return details
 
@@ -384,7 +564,11 @@ class BetterWorldBooksScraper:
         """Clean and normalize text"""
         if not text:
             return "Unknown"
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = text.strip()
+        # Most extracted strings are already clean; skip the regex engine
+        # unless there is actually whitespace to collapse
+        if '  ' in text or '\t' in text or '\n' in text:
+            text = _RE_WS.sub(' ', text)
         return text if text else "Unknown"
 
     def save_to_excel(self, data: List[Dict], filename: str = "better_world_books.xlsx") -> None:
@@ -393,9 +577,16 @@ class BetterWorldBooksScraper:
             logger.warning("No data to save")
             return
         
-        df = pd.DataFrame(data)
         try:
-            df.to_excel(filename, index=False)
+            # Write rows straight through openpyxl; building a DataFrame
+            # just to serialize a list of small dicts doubled the memory
+            keys = list(data[0].keys())
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet()
+            ws.append(keys)
+            for row in data:
+                ws.append([row.get(k) for k in keys])
+            wb.save(filename)
             logger.info(f"Data saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving to Excel: {str(e)}")
@@ -406,9 +597,11 @@ class BetterWorldBooksScraper:
             logger.warning("No data to save")
             return
         
-        df = pd.DataFrame(data)
         try:
-            df.to_csv(filename, index=False)
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(data[0].keys()), extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(data)
             logger.info(f"Data saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving to CSV: {str(e)}")
@@ -1,13 +1,36 @@
 import requests
+import requests_cache
+import asyncio
+import aiohttp
 from bs4 import BeautifulSoup
 import pandas as pd
 import time
+import csv
+import itertools
 import logging
 from urllib.parse import urljoin, quote_plus, urlparse
 import re
+import soupsieve
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 import random
 import json
+import weakref
+from datetime import timedelta
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+    _json_loads = json.loads
+from collections import OrderedDict
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+
+try:
+    from urllib3.response import HAS_ZSTD as _HAS_ZSTD
+except ImportError:  # pragma: no cover - older urllib3 without zstd support
+    _HAS_ZSTD = False
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -20,11 +43,109 @@ from selenium.webdriver.chrome.options import Options
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Repeated queries (ISBN batches especially) hit this cache instead of
+# re-encoding the same string
+_encode_query = lru_cache(maxsize=4096)(quote_plus)
+
+# Patterns shared by the extractor methods, compiled once at import
+_PRICE_RE = re.compile(r'[£$€¥]\s*[\d.,]+')
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_YEAR4_RE = re.compile(r'\d{4}')
+_ISBN_RE = re.compile(r'[\d-]{10,17}')
+_STAR_RE = re.compile(r'(\d+\.?\d*)\s*(?:out of|/)\s*5')
+_WS_RE = re.compile(r'\s+')
+_ISBN_QUERY_RE = re.compile(r'\d{9}[\dX]|\d{13}')
+_BY_RE = re.compile(r'^(by\s+)', re.I)
+
+# Hot author-row lookup, precompiled so select_one stops re-parsing the CSS
+_AUTHOR_ROW_SEL = soupsieve.compile('.a-row.a-size-base.a-color-secondary .a-row')
+
+# Per-field candidate selectors merged into single precompiled queries so
+# each field costs one traversal of the container
+_TITLE_SEL = soupsieve.compile(
+    'h3.title a, .title a, h2 a, h3 a, h4 a, .book-title a, a[title], '
+    'a[href*="/book/"], [itemprop="name"] a, .item-title a'
+)
+_PRICE_SEL = soupsieve.compile(
+    '.price, [class*="price"], .cost, [class*="cost"], [itemprop="price"], '
+    '.book-price, .item-price'
+)
+_FORMAT_SEL = soupsieve.compile(
+    '.format, [class*="format"], .binding, [class*="binding"], '
+    '[itemprop="bookFormat"], .book-format, .item-format'
+)
+_RATING_SEL = soupsieve.compile(
+    '.rating, [class*="rating"], .stars, [class*="stars"], [class*="review"], '
+    '.book-rating'
+)
+_PUBLISHER_SEL = soupsieve.compile(
+    '[itemprop="publisher"], .publisher, [class*="publisher"], '
+    '.book-publisher, .imprint'
+)
+_PUB_DATE_SEL = soupsieve.compile(
+    '[itemprop="datePublished"], .publication-date, .pub-date, '
+    '[class*="date"], .published'
+)
+_DETAIL_ISBN_SEL = soupsieve.compile('[itemprop="isbn"], .isbn, [class*="isbn"]')
+
+# All container-discovery strategies as one union, so the search page is
+# traversed once rather than once per strategy
+_CONTAINER_SEL = soupsieve.compile(
+    'div.book-item, div[class*=item-wrap], div[class*=book][class*=item], '
+    'article[class*=book], div[itemtype="http://schema.org/Book"], '
+    'div[class*=search-result], div[class*=result][class*=item], '
+    'div[class*=product][class*=item], div[data-cy*=book], '
+    'div[data-cy*=product], li[class*=book], div[class*=grid][class*=item]'
+)
+_DETAIL_RATING_SEL = soupsieve.compile('.rating, [class*="rating"], .stars, [class*="stars"]')
+
+def _quit_driver(driver):
+    """Finalizer target: must not reference the scraper instance"""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class _TokenBucket:
+    """Token-bucket limiter: bursts run at full speed, sustained traffic
+    is paced at `rate` requests per second"""
+
+    def __init__(self, rate: float = 1.0, burst: int = 5):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            time.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 0.0
+        else:
+            self.tokens -= 1
+
+
 class BookDepositoryBookScraper:
+    _DETAIL_CACHE_SIZE = 1024
+    _READ_CHUNK = 65536
+    _MAX_CHUNKS = 48  # ~3MB cap; the Amazon-hosted search pages run large
     def __init__(self):
-        self.session = requests.Session()
+        # Product pages are static for days; cache them on disk so repeated
+        # runs and duplicate editions skip the network entirely
+        self.session = requests_cache.CachedSession(
+            'bd_cache',
+            backend='sqlite',
+            expire_after=timedelta(days=7),
+            allowable_codes=(200,),
+            stale_if_error=True,
+        )
         self.driver = None
+        self._driver_finalizer = None
         self.base_url = "https://www.bookdepository.com"
+        self._base_url_no_slash = self.base_url.rstrip('/')
         self.search_url = "https://www.amazon.com/s?k="
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
@@ -34,31 +155,14 @@ class BookDepositoryBookScraper:
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
         ]
         
-        # Initialize headers
+        # Static headers, set once; zstd joins the accepted encodings only
+        # when this urllib3 build can actually decode it, otherwise the
+        # server would hand us compressed bytes the parser can't read
         self.headers = {
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Referer': 'https://www.google.com/',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'cross-site',
-            'Pragma': 'no-cache',
-            'Cache-Control': 'no-cache',
-        }
-        
-        # Update headers with random user agent
-        self.update_headers()
-    
-    def update_headers(self):
-        """Update headers with random user agent and BookDepository-specific headers"""
-        self.headers.update({
-            "User-Agent": random.choice(self.user_agents),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
+            "Accept-Encoding": "gzip, deflate, br" + (", zstd" if _HAS_ZSTD else ""),
+            "Referer": "https://www.google.com/",
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
             "Sec-Fetch-Dest": "document",
@@ -70,11 +174,34 @@ class BookDepositoryBookScraper:
             "Sec-CH-UA": '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
             "Sec-CH-UA-Mobile": "?0",
             "Sec-CH-UA-Platform": '"Windows"'
-        })
-        
-        # Update session headers
+        }
         self.session.headers.update(self.headers)
         
+        # Pick the initial user agent
+        self.update_headers()
+        
+        # Paces outbound requests; pure-DOM work no longer sleeps
+        self._limiter = _TokenBucket(rate=1.0, burst=5)
+        
+        # LRU of parsed product-page details keyed by URL; sits in front of
+        # the on-disk HTTP cache so repeat hits skip even the parse
+        self._detail_cache = OrderedDict()
+        
+        # Sized adapter pool so search and detail fetches reuse the same
+        # TLS connection instead of re-handshaking per URL. Pooling only:
+        # retries, backoff and the Selenium fallback all live in
+        # make_request_with_retry, and adapter-level retries would stack
+        # multiplicatively on top of that loop
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def update_headers(self):
+        """Rotate only the User-Agent; the other headers are static"""
+        user_agent = random.choice(self.user_agents)
+        self.headers["User-Agent"] = user_agent
+        self.session.headers["User-Agent"] = user_agent
+        
     def setup_selenium_driver(self):
         """Setup Selenium WebDriver with proper configuration"""
         if self.driver:
@@ -90,23 +217,57 @@ class BookDepositoryBookScraper:
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # The scraper only reads HTML; skip downloading images entirely
+        chrome_options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
         
         self.driver = webdriver.Chrome(options=chrome_options)
+        # finalize is idempotent and runs independently of interpreter
+        # shutdown ordering, unlike __del__, so Chrome cannot be orphaned
+        self._driver_finalizer = weakref.finalize(self, _quit_driver, self.driver)
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        # Block heavy resource types at the network layer; the load event
+        # fires sooner and page bytes drop to roughly the HTML itself
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': [
+                '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+                '*.woff', '*.woff2', '*.ttf', '*.css',
+                '*googletagmanager*', '*doubleclick*', '*google-analytics*',
+            ]})
+        except Exception as e:
+            logger.warning(f"Could not enable CDP resource blocking: {str(e)}")
         return self.driver
         
-    def make_request_with_retry(self, url: str, max_retries: int = 3, timeout: int = 30) -> Optional[requests.Response]:
+    def make_request_with_retry(self, url: str, max_retries: int = 3, timeout: int = 30,
+                                use_cache: bool = True) -> Optional[requests.Response]:
         """Make HTTP request with retry logic and error handling"""
         for attempt in range(max_retries):
             try:
-                self.update_headers()
                 if attempt > 0:
-                    delay = random.uniform(3, 7)
+                    # Exponential backoff with jitter, capped at a minute;
+                    # rotate the user agent only when retrying
+                    delay = min(60, 2 ** attempt + random.random())
                     logger.info(f"Retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
                     time.sleep(delay)
+                    self.update_headers()
 
-                response = self.session.get(url, timeout=timeout)
+                self._limiter.acquire()
+                # expire_after=0 tells requests_cache not to store this one
+                response = self.session.get(
+                    url, timeout=timeout, stream=True,
+                    expire_after=None if use_cache else requests_cache.DO_NOT_CACHE,
+                )
                 response.raise_for_status()
+                # Stream with a size cap instead of materializing the whole
+                # body; search pages haul megabytes of script we never parse
+                body = b''.join(
+                    itertools.islice(response.iter_content(self._READ_CHUNK), self._MAX_CHUNKS)
+                )
+                response.close()  # Return the connection to the pool
+                response._content = body
+                response._content_consumed = True
                 return response
                 
             except requests.exceptions.Timeout:
@@ -118,6 +279,85 @@ class BookDepositoryBookScraper:
         logger.info("Falling back to Selenium...")
         return self.make_selenium_request(url)
     
+    async def _fetch_page_async(self, session, semaphore, url: str, max_retries: int = 3, timeout: int = 20) -> Optional[bytes]:
+        """Fetch a single page with aiohttp, with retries and bounded concurrency"""
+        async with semaphore:
+            for attempt in range(max_retries):
+                try:
+                    if attempt > 0:
+                        delay = random.uniform(2, 5)
+                        logger.info(f"Async retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
+                        await asyncio.sleep(delay)
+
+                    async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                        response.raise_for_status()
+                        return await response.read()
+
+                except asyncio.TimeoutError:
+                    logger.warning(f"Async timeout on attempt {attempt + 1}/{max_retries} for {url}")
+                except aiohttp.ClientError as e:
+                    logger.warning(f"Async request failed on attempt {attempt + 1}/{max_retries}: {str(e)}")
+
+            return None
+
+    async def _fetch_pages_async(self, urls: List[str], concurrency: int = 8) -> Dict[str, Optional[bytes]]:
+        """Fetch multiple pages concurrently over one connection pool"""
+        semaphore = asyncio.BoundedSemaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, headers=dict(self.headers)) as session:
+            pages = await asyncio.gather(
+                *[self._fetch_page_async(session, semaphore, url) for url in urls]
+            )
+        return dict(zip(urls, pages))
+
+    def _fetch_detail_pages(self, urls: List[str]) -> Dict[str, Dict]:
+        """Fetch and parse a batch of product pages concurrently (sync facade)"""
+        details_by_url = {}
+        to_fetch = []
+        for url in dict.fromkeys(urls):  # De-duplicate, preserving order
+            cached = self._detail_cache_get(url)
+            if cached is not None:
+                details_by_url[url] = cached
+            else:
+                to_fetch.append(url)
+        if not to_fetch:
+            return details_by_url
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Can't start a nested asyncio.run; the pooled session is
+            # thread-safe for GETs, so fan out over threads instead
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for url, details in zip(to_fetch, executor.map(self.get_book_details_from_page, to_fetch)):
+                    if details:
+                        details_by_url[url] = details
+                return details_by_url
+
+        pages = asyncio.run(self._fetch_pages_async(to_fetch))
+        for url, html in pages.items():
+            if html:
+                soup = BeautifulSoup(html, 'lxml')
+                details = self._parse_detail_page(soup, url)
+                if details:
+                    details_by_url[url] = details
+                    self._detail_cache_put(url, details)
+        return details_by_url
+
+    def _detail_cache_get(self, url: str) -> Optional[Dict]:
+        cached = self._detail_cache.get(url)
+        if cached is not None:
+            self._detail_cache.move_to_end(url)
+        return cached
+
+    def _detail_cache_put(self, url: str, details: Dict) -> None:
+        self._detail_cache[url] = details
+        self._detail_cache.move_to_end(url)
+        while len(self._detail_cache) > self._DETAIL_CACHE_SIZE:
+            self._detail_cache.popitem(last=False)
+
     def make_selenium_request(self, url: str) -> Optional[requests.Response]:
         """Make request using Selenium as fallback"""
         try:
@@ -129,54 +369,44 @@ class BookDepositoryBookScraper:
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
-            # Create a mock response object
-            class MockResponse:
-                def __init__(self, content, url, status_code=200):
-                    self.content = content.encode('utf-8')
-                    self.text = content
-                    self.url = url
-                    self.status_code = status_code
-                
-                def raise_for_status(self):
-                    if self.status_code >= 400:
-                        raise requests.exceptions.HTTPError(f"HTTP {self.status_code}")
-            
+            # Build a real Response so downstream code gets proper encoding
+            # handling and the object stays interchangeable with session.get
             page_source = driver.page_source
-            return MockResponse(page_source, url)
+            response = requests.Response()
+            response._content = page_source.encode('utf-8')
+            response.status_code = 200
+            response.url = url
+            response.encoding = 'utf-8'
+            response.headers['Content-Type'] = 'text/html; charset=utf-8'
+            return response
             
         except Exception as e:
             logger.error(f"Selenium request failed: {str(e)}")
             return None
-        finally:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
 
     def search_bookdepository(self, book_query: str, max_results: int = 5) -> List[Dict]:
         """Search BookDepository for books"""
         try:
             # First, visit the homepage to establish session
             logger.info("Establishing session with BookDepository...")
-            home_response = self.make_request_with_retry(self.base_url, timeout=15)
+            home_response = self.make_request_with_retry(self.base_url, timeout=15, use_cache=False)
             if not home_response:
                 logger.error("Failed to establish session with BookDepository")
                 return []
             
-            # Add a small delay
-            time.sleep(random.uniform(1, 3))
-            
             # Construct search URL - BookDepository uses 'searchTerm' parameter
-            search_url = f"{self.search_url}{quote_plus(book_query)}"
+            search_url = f"{self.search_url}{_encode_query(book_query)}"
             
             logger.info(f"Searching BookDepository for: {book_query}")
             logger.info(f"Search URL: {search_url}")
             
-            response = self.make_request_with_retry(search_url, timeout=20)
+            # Search results change constantly; only product pages cache
+            response = self.make_request_with_retry(search_url, timeout=20, use_cache=False)
             if not response:
                 logger.error("Failed to get search results from BookDepository")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             results = []
             
             # Debug: Print some of the page content to understand structure
@@ -199,13 +429,23 @@ class BookDepositoryBookScraper:
             
             count = 0
             for container in book_containers[:max_results * 2]:  # Get more to account for filtering
-                book_data = self.extract_book_details_bd(container, soup)
+                book_data = self.extract_book_details_bd(container, soup, fetch_details=False)
                 if book_data and count < max_results:
                     results.append(book_data)
                     count += 1
-                
-                # Add delay between extractions
-                time.sleep(random.uniform(0.5, 1.5))
+            
+            # Fan the product pages out concurrently instead of fetching one
+            # per container inside the loop
+            detail_urls = [book['URL'] for book in results if book['URL'] != "N/A" and "http" in book['URL']]
+            details_by_url = self._fetch_detail_pages(detail_urls)
+            for book_data in results:
+                detailed_info = details_by_url.get(book_data['URL'])
+                if detailed_info:
+                    book_data['Publisher'] = self.clean_text(detailed_info.get('publisher', book_data['Publisher']))
+                    book_data['Publication_Year'] = detailed_info.get('pub_year', book_data['Publication_Year'])
+                    book_data['ISBN'] = detailed_info.get('isbn', book_data['ISBN'])
+                    if book_data['Format'] == "N/A":
+                        book_data['Format'] = detailed_info.get('format', "N/A")
             
             logger.info(f"Successfully extracted {len(results)} books from BookDepository")
             return results
@@ -215,44 +455,26 @@ class BookDepositoryBookScraper:
             return []
     
     def find_book_containers(self, soup):
-        """Find book containers using multiple selector strategies for BookDepository"""
-        book_containers = []
-        
-        # BookDepository-specific selectors
-        selectors = [
-            ('div', {'class': 'book-item'}),
-            ('div', {'class': re.compile(r'item-wrap')}),
-            ('div', {'class': re.compile(r'book.*item')}),
-            ('article', {'class': re.compile(r'book')}),
-            ('div', {'itemtype': 'http://schema.org/Book'}),
-            ('div', {'class': re.compile(r'search-result')}),
-            ('div', {'class': re.compile(r'result.*item')}),
-            ('div', {'class': re.compile(r'product.*item')}),
-            ('div', {'data-cy': re.compile(r'book|product')}),
-            ('li', {'class': re.compile(r'book')}),
-            ('div', {'class': re.compile(r'grid.*item')}),
-        ]
-        
-        for tag, attrs in selectors:
-            book_containers = soup.find_all(tag, attrs)
-            if book_containers:
-                logger.info(f"Found {len(book_containers)} books using {tag} with {attrs}")
-                break
+        """Find book containers with one precompiled union selector"""
+        book_containers = _CONTAINER_SEL.select(soup)
+        if book_containers:
+            logger.info(f"Found {len(book_containers)} book containers")
         
         return book_containers
     
-    def extract_book_details_bd(self, container, full_soup) -> Optional[Dict]:
+    def extract_book_details_bd(self, container, full_soup, fetch_details: bool = True) -> Optional[Dict]:
         """Extract book details from BookDepository search result container"""
         try:
             # Initialize default values
-            title = "Unknown Title",
-            author = "Unknown Author",
-            publisher = "Unknown Publisher",
-            pub_year = "Unknown",
-            isbn = "N/A",
-            price = "N/A",
-            book_url = "N/A",
-            format = "N/A",
+            title = "Unknown Title"
+            author = "Unknown Author"
+            publisher = "Unknown Publisher"
+            pub_year = "Unknown"
+            isbn = "N/A"
+            price = "N/A"
+            book_url = "N/A"
+            rating = "N/A"
+            format = "N/A"
             
             # Extract title using multiple strategies
             title, book_url = self.extract_title_and_url(container)
@@ -271,7 +493,8 @@ class BookDepositoryBookScraper:
             pub_year = self.extract_publication_year(container)
             
             # If we have a book URL, try to get more details from the product page
-            if book_url != "N/A" and "http" in book_url:
+            # (skipped when the caller batches the detail fetches itself)
+            if fetch_details and book_url != "N/A" and "http" in book_url:
                 detailed_info = self.get_book_details_from_page(book_url)
                 if detailed_info:
                     publisher = detailed_info.get('publisher', publisher)
@@ -312,25 +535,7 @@ class BookDepositoryBookScraper:
         title = "Unknown Title"
         book_url = "N/A"
         
-        # BookDepository-specific title selectors
-        title_selectors = [
-            'h3.title a',
-            '.title a',
-            'h2 a',
-            'h3 a',
-            'h4 a',
-            '.book-title a',
-            'a[title]',
-            'a[href*="/book/"]',  # BookDepository book URLs contain /book/
-            '[itemprop="name"] a',
-            '.item-title a',
-        ]
-        
-        title_elem = None
-        for selector in title_selectors:
-            title_elem = container.select_one(selector)
-            if title_elem:
-                break
+        title_elem = next(_TITLE_SEL.iselect(container), None)
         
         if not title_elem:
             # Fallback: find any link that looks like a book title
@@ -346,7 +551,13 @@ class BookDepositoryBookScraper:
             title = title_elem.get_text(strip=True)
             href = title_elem.get('href')
             if href:
-                book_url = urljoin(self.base_url, href)
+                # Skip urljoin's double URL parse for the common href shapes
+                if href.startswith('http'):
+                    book_url = href
+                elif href.startswith('/'):
+                    book_url = self._base_url_no_slash + href
+                else:
+                    book_url = urljoin(self.base_url, href)
         
         return title, book_url
     
@@ -356,7 +567,7 @@ class BookDepositoryBookScraper:
 
         # Try to find BookDepository/Amazon-style author row
         # Look for a row with multiple <span class="a-size-base">, possibly with "by" prefix
-        author_row = container.select_one('.a-row.a-size-base.a-color-secondary .a-row')
+        author_row = next(_AUTHOR_ROW_SEL.iselect(container), None)
         if author_row:
             spans = author_row.find_all('span', class_='a-size-base')
             # Filter out 'by' and ',' and 'et al.' and join the rest
@@ -387,29 +598,16 @@ class BookDepositoryBookScraper:
         """Extract price from container"""
         price = "N/A"
         
-        # BookDepository-specific price selectors
-        price_selectors = [
-            '.price',
-            '[class*="price"]',
-            '.cost',
-            '[class*="cost"]',
-            '[itemprop="price"]',
-            '.book-price',
-            '.item-price',
-        ]
-        
-        for selector in price_selectors:
-            price_elem = container.select_one(selector)
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                # Extract price using regex - handle different currencies
-                price_match = re.search(r'[£$€¥]\s*[\d.,]+', price_text)
-                if price_match:
-                    price = price_match.group()
-                    break
-                elif price_text and any(char in price_text for char in ['£', '$', '€', '¥']):
-                    price = price_text
-                    break
+        for price_elem in _PRICE_SEL.iselect(container):
+            price_text = price_elem.get_text(strip=True)
+            # Extract price using regex - handle different currencies
+            price_match = _PRICE_RE.search(price_text)
+            if price_match:
+                price = price_match.group()
+                break
+            elif price_text and any(char in price_text for char in ['£', '$', '€', '¥']):
+                price = price_text
+                break
         
         return price
     
@@ -417,23 +615,10 @@ class BookDepositoryBookScraper:
         """Extract format from container"""
         format = "N/A"
         
-        # BookDepository-specific format selectors
-        format_selectors = [
-            '.format',
-            '[class*="format"]',
-            '.binding',
-            '[class*="binding"]',
-            '[itemprop="bookFormat"]',
-            '.book-format',
-            '.item-format',
-        ]
-        
-        for selector in format_selectors:
-            format_elem = container.select_one(selector)
-            if format_elem:
-                format = format_elem.get_text(strip=True)
-                if format:
-                    break
+        for format_elem in _FORMAT_SEL.iselect(container):
+            format = format_elem.get_text(strip=True)
+            if format:
+                break
         
         return format
     
@@ -441,28 +626,16 @@ class BookDepositoryBookScraper:
         """Extract rating from container"""
         rating = "N/A"
         
-        # BookDepository-specific rating selectors
-        rating_selectors = [
-            '.rating',
-            '[class*="rating"]',
-            '.stars',
-            '[class*="stars"]',
-            '[class*="review"]',
-            '.book-rating',
-        ]
-        
-        for selector in rating_selectors:
-            rating_elem = container.select_one(selector)
-            if rating_elem:
-                rating_text = rating_elem.get_text(strip=True)
-                # Look for star ratings or numeric ratings
-                star_match = re.search(r'(\d+\.?\d*)\s*(?:out of|/)\s*5', rating_text)
-                if star_match:
-                    rating = f"{star_match.group(1)}/5"
-                    break
-                elif rating_text:
-                    rating = rating_text
-                    break
+        for rating_elem in _RATING_SEL.iselect(container):
+            rating_text = rating_elem.get_text(strip=True)
+            # Look for star ratings or numeric ratings
+            star_match = _STAR_RE.search(rating_text)
+            if star_match:
+                rating = f"{star_match.group(1)}/5"
+                break
+            elif rating_text:
+                rating = rating_text
+                break
         
         return rating
     
@@ -470,21 +643,10 @@ class BookDepositoryBookScraper:
         """Extract publisher from container"""
         publisher = "Unknown Publisher"
         
-        # BookDepository-specific publisher selectors
-        publisher_selectors = [
-            '[itemprop="publisher"]',
-            '.publisher',
-            '[class*="publisher"]',
-            '.book-publisher',
-            '.imprint',
-        ]
-        
-        for selector in publisher_selectors:
-            publisher_elem = container.select_one(selector)
-            if publisher_elem:
-                publisher = publisher_elem.get_text(strip=True)
-                if publisher:
-                    break
+        for publisher_elem in _PUBLISHER_SEL.iselect(container):
+            publisher = publisher_elem.get_text(strip=True)
+            if publisher:
+                break
         
         return publisher
     
@@ -492,36 +654,41 @@ class BookDepositoryBookScraper:
         """Extract publication year from container"""
         pub_year = "Unknown"
         
-        # BookDepository-specific publication date selectors
-        pub_selectors = [
-            '[itemprop="datePublished"]',
-            '.publication-date',
-            '.pub-date',
-            '[class*="date"]',
-            '.published',
-        ]
-        
-        for selector in pub_selectors:
-            pub_elem = container.select_one(selector)
-            if pub_elem:
-                pub_text = pub_elem.get_text(strip=True)
-                year_match = re.search(r'\b(19|20)\d{2}\b', pub_text)
-                if year_match:
-                    pub_year = year_match.group()
-                    break
+        for pub_elem in _PUB_DATE_SEL.iselect(container):
+            pub_text = pub_elem.get_text(strip=True)
+            year_match = _YEAR_RE.search(pub_text)
+            if year_match:
+                pub_year = year_match.group()
+                break
         
         return pub_year
     
     def get_book_details_from_page(self, book_url: str) -> Optional[Dict]:
         """Get additional book details from individual product page"""
-        try:
-            response = self.make_request_with_retry(book_url, timeout=15)
-            if not response:
-                return None
+        cached = self._detail_cache_get(book_url)
+        if cached is not None:
+            return cached
+
+        response = self.make_request_with_retry(book_url, timeout=15)
+        if not response:
+            return None
+
+        soup = BeautifulSoup(response.content, 'lxml')
+        details = self._parse_detail_page(soup, book_url)
+        if details:
+            self._detail_cache_put(book_url, details)
+        return details
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+    def _parse_detail_page(self, soup, book_url: str) -> Optional[Dict]:
+        """Pull publisher, year, ISBN, format and rating out of a parsed product page"""
+        try:
             details = {}
 
+            # JSON-LD first: it is cheap to read and authoritative when present
+            self._fill_from_json_ld(soup, details)
+            if {'publisher', 'pub_year', 'isbn', 'format'} <= details.keys():
+                return details
+
             # Try to extract details from Amazon-style detail bullets
             detail_div = soup.find('div', id='detailBullets_feature_div')
             if detail_div:
@@ -537,7 +704,7 @@ class BookDepositoryBookScraper:
                         details['publisher'] = value
                     elif 'publication date' in label:
                         # Try to extract year
-                        year_match = re.search(r'\b(19|20)\d{2}\b', value)
+                        year_match = _YEAR_RE.search(value)
                         if year_match:
                             details['pub_year'] = year_match.group()
                         else:
@@ -551,106 +718,71 @@ class BookDepositoryBookScraper:
 
             # Fallback to BookDepository selectors if not found above
             if 'isbn' not in details:
-                isbn_selectors = [
-                    '[itemprop="isbn"]',
-                    '.isbn',
-                    '[class*="isbn"]',
-                ]
-                for selector in isbn_selectors:
-                    isbn_elem = soup.select_one(selector)
-                    if isbn_elem:
-                        isbn_text = isbn_elem.get_text(strip=True)
-                        isbn_match = re.search(r'[\d-]{10,17}', isbn_text)
-                        if isbn_match:
-                            details['isbn'] = isbn_match.group()
-                            break
+                for isbn_elem in _DETAIL_ISBN_SEL.iselect(soup):
+                    isbn_match = _ISBN_RE.search(isbn_elem.get_text(strip=True))
+                    if isbn_match:
+                        details['isbn'] = isbn_match.group()
+                        break
 
             if 'publisher' not in details:
-                publisher_selectors = [
-                    '[itemprop="publisher"]',
-                    '.publisher',
-                    '[class*="publisher"]',
-                ]
-                for selector in publisher_selectors:
-                    pub_elem = soup.select_one(selector)
-                    if pub_elem:
-                        details['publisher'] = pub_elem.get_text(strip=True)
-                        break
+                pub_elem = next(_PUBLISHER_SEL.iselect(soup), None)
+                if pub_elem:
+                    details['publisher'] = pub_elem.get_text(strip=True)
 
             if 'pub_year' not in details:
-                date_selectors = [
-                    '[itemprop="datePublished"]',
-                    '.publication-date',
-                ]
-                for selector in date_selectors:
-                    date_elem = soup.select_one(selector)
-                    if date_elem:
-                        date_text = date_elem.get_text(strip=True)
-                        year_match = re.search(r'\b(19|20)\d{2}\b', date_text)
-                        if year_match:
-                            details['pub_year'] = year_match.group()
-                            break
+                for date_elem in _PUB_DATE_SEL.iselect(soup):
+                    year_match = _YEAR_RE.search(date_elem.get_text(strip=True))
+                    if year_match:
+                        details['pub_year'] = year_match.group()
+                        break
 
             if 'format' not in details:
-                format_selectors = [
-                    '[itemprop="bookFormat"]',
-                    '.format',
-                    '[class*="format"]',
-                ]
-                for selector in format_selectors:
-                    format_elem = soup.select_one(selector)
-                    if format_elem:
-                        details['format'] = format_elem.get_text(strip=True)
-                        break
+                format_elem = next(_FORMAT_SEL.iselect(soup), None)
+                if format_elem:
+                    details['format'] = format_elem.get_text(strip=True)
 
             # Look for rating
-            rating_selectors = [
-                '.rating',
-                '[class*="rating"]',
-                '.stars',
-                '[class*="stars"]',
-            ]
-            for selector in rating_selectors:
-                rating_elem = soup.select_one(selector)
-                if rating_elem:
-                    rating_text = rating_elem.get_text(strip=True)
-                    star_match = re.search(r'(\d+\.?\d*)\s*(?:out of|/)\s*5', rating_text)
-                    if star_match:
-                        details['rating'] = f"{star_match.group(1)}/5"
-                        break
-                    elif rating_text:
-                        details['rating'] = rating_text
-                        break
-
-            # Look for JSON-LD structured data
-            scripts = soup.find_all('script', type='application/ld+json')
-            for script in scripts:
-                try:
-                    if script.string:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict) and data.get('@type') == 'Book':
-                            if 'publisher' in data and 'publisher' not in details:
-                                pub_info = data['publisher']
-                                if isinstance(pub_info, dict):
-                                    details['publisher'] = pub_info.get('name', '')
-                                else:
-                                    details['publisher'] = str(pub_info)
-                            if 'datePublished' in data and 'pub_year' not in details:
-                                year_match = re.search(r'\d{4}', data['datePublished'])
-                                if year_match:
-                                    details['pub_year'] = year_match.group()
-                            if 'isbn' in data and 'isbn' not in details:
-                                details['isbn'] = data['isbn']
-                            if 'bookFormat' in data and 'format' not in details:
-                                details['format'] = data['bookFormat']
-                except (json.JSONDecodeError, AttributeError):
-                    continue
+            for rating_elem in _DETAIL_RATING_SEL.iselect(soup):
+                rating_text = rating_elem.get_text(strip=True)
+                star_match = _STAR_RE.search(rating_text)
+                if star_match:
+                    details['rating'] = f"{star_match.group(1)}/5"
+                    break
+                elif rating_text:
+                    details['rating'] = rating_text
+                    break
 
             return details
 
         except Exception as e:
             logger.error(f"Error getting book details from page {book_url}: {str(e)}")
             return None
+
+    @staticmethod
+    def _fill_from_json_ld(soup, details: Dict) -> None:
+        """Populate missing fields from JSON-LD structured data"""
+        for script in soup.find_all('script', type='application/ld+json'):
+            try:
+                if script.string:
+                    # orjson rejects bs4's str subclass; hand it plain bytes
+                    data = _json_loads(script.string.encode())
+                    if isinstance(data, dict) and data.get('@type') == 'Book':
+                        if 'publisher' in data and 'publisher' not in details:
+                            pub_info = data['publisher']
+                            if isinstance(pub_info, dict):
+                                details['publisher'] = pub_info.get('name', '')
+                            else:
+                                details['publisher'] = str(pub_info)
+                        if 'datePublished' in data and 'pub_year' not in details:
+                            year_match = _YEAR4_RE.search(data['datePublished'])
+                            if year_match:
+                                details['pub_year'] = year_match.group()
+                        if 'isbn' in data and 'isbn' not in details:
+                            details['isbn'] = data['isbn']
+                        if 'bookFormat' in data and 'format' not in details:
+                            details['format'] = data['bookFormat']
+            except (ValueError, AttributeError):
+                continue
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
@@ -658,16 +790,55 @@ class BookDepositoryBookScraper:
             return "Unknown"
         
         # Remove extra whitespace and newlines
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         
         # Remove common prefixes
-        text = re.sub(r'^(by\s+)', '', text, flags=re.I)
+        text = _BY_RE.sub('', text)
         
         return text if text else "Unknown"
     
     def search_by_isbn(self, isbn: str) -> List[Dict]:
         """Search BookDepository by ISBN"""
+        # A well-formed ISBN maps straight to the canonical product URL,
+        # skipping the search round trip and its megabyte of HTML
+        digits = isbn.replace('-', '').replace(' ', '')
+        if _ISBN_QUERY_RE.fullmatch(digits):
+            book = self._book_from_detail(f"{self.base_url}/book/{digits}")
+            if book:
+                return [book]
         return self.search_bookdepository(isbn, max_results=1)
+
+    def _book_from_detail(self, book_url: str) -> Optional[Dict]:
+        """Build a result record from a product page alone"""
+        try:
+            response = self.make_request_with_retry(book_url, timeout=15)
+            if not response:
+                return None
+
+            soup = BeautifulSoup(response.content, 'lxml')
+            details = self._parse_detail_page(soup, book_url) or {}
+
+            title_elem = soup.find('h1') or soup.title
+            title = self.clean_text(title_elem.get_text(strip=True)) if title_elem else "Unknown Title"
+            author = self.extract_author(soup)
+
+            if title == "Unknown Title" and not details:
+                return None
+
+            return {
+                "Site": "BookDepository",
+                "Title": title,
+                "Author": author,
+                "Publisher": self.clean_text(details.get('publisher', 'Unknown Publisher')),
+                "Publication_Year": details.get('pub_year', 'Unknown'),
+                "ISBN": details.get('isbn', 'N/A'),
+                "Price": self.extract_price(soup),
+                "URL": book_url,
+                "Format": details.get('format', 'N/A'),
+            }
+        except Exception as e:
+            logger.error(f"Error building record from {book_url}: {str(e)}")
+            return None
     
     def search_by_title_author(self, title: str, author: str = "") -> List[Dict]:
         """Search BookDepository by title and author"""
@@ -683,7 +854,8 @@ class BookDepositoryBookScraper:
         df = pd.DataFrame(data)
         
         try:
-            df.to_excel(filename, index=False)
+            # xlsxwriter is much faster than openpyxl for flat write-only sheets
+            df.to_excel(filename, index=False, engine='xlsxwriter')
             logger.info(f"Data saved to {filename}")
             logger.info(f"Total books found: {len(df)}")
             
@@ -701,26 +873,31 @@ class BookDepositoryBookScraper:
             logger.error(f"Error saving to Excel: {str(e)}")
 
     def save_to_csv(self, data: List[Dict], filename: str = "bookdepository_books.csv") -> None:
-        """Save book data to CSV"""
+        """Save book data to CSV, streaming rows without a DataFrame"""
         if not data:
             logger.warning("No data to save")
             return
         
-        df = pd.DataFrame(data)
-        
         try:
-            df.to_csv(filename, index=False)
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(data[0].keys()), extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(data)
             logger.info(f"Data saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving to CSV: {str(e)}")
 
-    def __del__(self):
-        """Cleanup when object is destroyed"""
-        if self.driver:
-            try:
-                self.driver.quit()
-            except:
-                pass
+    def close(self):
+        """Shut down the shared Selenium driver, if one was started"""
+        if self._driver_finalizer is not None:
+            self._driver_finalizer()
+        self.driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
 
 
 # Example usage
@@ -750,4 +927,4 @@ if __name__ == "__main__":
         print("No results found!")
     
     # Clean up
-    del scraper
\ No newline at end of file
+    scraper.close()
\ No newline at end of file
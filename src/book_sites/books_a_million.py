@@ -1,7 +1,12 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import asyncio
+import aiohttp
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+import csv
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from urllib.parse import urljoin, quote_plus, urlparse
 import re
@@ -9,11 +14,133 @@ from typing import List, Dict, Optional
 import random
 import json
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+    _json_loads = json.loads
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Prefer the C-backed lxml parser; fall back to the stdlib parser if lxml is missing
+try:
+    BeautifulSoup("", "lxml")
+    _BS_PARSER = "lxml"
+except FeatureNotFound:
+    _BS_PARSER = "html.parser"
+
+# Common container selectors for Books-A-Million, combined into one
+# comma-separated selector so the DOM is walked once instead of per-probe
+_CONTAINER_SELECTOR = ', '.join([
+    'div[class*="product-item"]',
+    'div[class*="search-result"]',
+    'div[class*="book-item"]',
+    'div[class*="product-tile"]',
+    'div[class*="item-container"]',
+    'div[data-testid*="product"]',
+    'div[class*="product-card"]',
+    'div[class*="result-item"]'
+])
+
+# Per-field union selectors: one comma-separated probe per field means a
+# single tree traversal returning the first match in document order
+_TITLE_SELECTOR = ', '.join((
+    'h3 a',
+    'h4 a',
+    'a[class*="title"]',
+    'a[class*="product-title"]',
+    'div[class*="title"] a',
+    'span[class*="title"]',
+    '[data-testid*="title"] a',
+    'a[href*="/p/"]'  # Books-A-Million product URLs often contain /p/
+))
+_AUTHOR_SELECTOR = ', '.join((
+    'span[class*="author"]',
+    'div[class*="author"]',
+    'a[class*="author"]',
+    '[data-testid*="author"]',
+    'p[class*="author"]'
+))
+_PRICE_SELECTOR = ', '.join((
+    'span[class*="price"]',
+    'div[class*="price"]',
+    '[data-testid*="price"]',
+    'span[class*="cost"]',
+    'div[class*="cost"]'
+))
+_RATING_SELECTOR = ', '.join((
+    'span[class*="rating"]',
+    'div[class*="rating"]',
+    'div[class*="stars"]',
+    '[data-testid*="rating"]'
+))
+_FORMAT_SELECTOR = ', '.join((
+    'span[class*="format"]',
+    'div[class*="format"]',
+    'span[class*="binding"]',
+    'div[class*="binding"]'
+))
+
+# Compiled once; the inline re.sub/re.search calls hit the re cache lock per call
+_WS_RE = re.compile(r'\s+')
+_BY_RE = re.compile(r'^by\s+', re.I)
+_BY_TEXT_RE = re.compile(r'by\s+\w+', re.I)
+_ENTITY_RE = re.compile(r'&[a-zA-Z0-9#]+;')
+_YEAR_RE = re.compile(r'\d{4}')
+_ISBN_RE = re.compile(r'[\d-]{10,17}')
+_PRICE_RE = re.compile(r'\$[\d,]+\.?\d*')
+_RATING_RE = re.compile(r'(\d+\.?\d*)')
+_CONTAINER_CLASS_RE = re.compile(r'product|item|result|tile|card')
+_SPEC_CLASS_RE = re.compile(r'spec|detail|product')
+_INDICATOR_RE = re.compile(r'title|author|price|isbn|book|product')
+
+# The detail parse only touches the details/spec sections plus meta and
+# JSON-LD tags, so skip building the rest of the product-page tree
+_DETAIL_SECTION_CLASS_RE = re.compile(r'product-details|book-details|item-details|spec|detail|product')
+
+
+def _detail_match(name, attrs):
+    if name in ('meta', 'script'):
+        return True
+    if name in ('div', 'table'):
+        cls = attrs.get('class', '')
+        if isinstance(cls, list):
+            cls = ' '.join(cls)
+        return bool(cls and _DETAIL_SECTION_CLASS_RE.search(cls))
+    return False
+
+
+_DETAIL_STRAINER = SoupStrainer(_detail_match)
+
+
+class _TokenBucket:
+    """Token-bucket limiter: bursts run at full speed, sustained traffic
+    is paced at `rate` requests per second"""
+
+    def __init__(self, rate: float = 1.0, burst: int = 3):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            self.tokens = 0.0
+        else:
+            self.tokens -= 1
+
+
 class BooksAMillionScraper:
+    # Bounded in-process cache for parsed product-page details
+    _DETAIL_CACHE_SIZE = 512
+
     def __init__(self):
         self.session = requests.Session()
         self.base_url = "https://www.booksamillion.com"
@@ -24,8 +151,20 @@ class BooksAMillionScraper:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15"
         ]
+        # Keep-alive pool sized for the product-page fan-out against one
+        # host. Pooling only: make_request_with_retry already retries with
+        # its own backoff, and adapter retries would multiply those attempts
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._detail_cache = OrderedDict()
+        self._limiter = _TokenBucket(rate=1.0, burst=3)
         self.update_headers()
-    
+
     def update_headers(self):
         """Update headers with random user agent"""
         self.session.headers.update({
@@ -46,12 +185,15 @@ class BooksAMillionScraper:
         """Make HTTP request with retry logic and error handling"""
         for attempt in range(max_retries):
             try:
-                self.update_headers()
                 if attempt > 0:
+                    # Only re-roll the user agent when the previous attempt failed
+                    self.update_headers()
                     delay = random.uniform(3, 7)
                     logger.info(f"Retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
                     time.sleep(delay)
                 
+                # Pace the actual HTTP traffic; CPU-only work stays unthrottled
+                self._limiter.acquire()
                 response = self.session.get(url, timeout=timeout)
                 response.raise_for_status()
                 return response
@@ -60,9 +202,84 @@ class BooksAMillionScraper:
                 logger.warning(f"Timeout on attempt {attempt + 1}/{max_retries}")
             except requests.exceptions.RequestException as e:
                 logger.warning(f"Request failed on attempt {attempt + 1}/{max_retries}: {str(e)}")
-        
+
+        return None
+
+    async def _fetch_page_async(self, session, url: str, max_retries: int = 3, timeout: int = 15) -> Optional[bytes]:
+        """Fetch a single page with aiohttp, retrying with backoff"""
+        for attempt in range(max_retries):
+            try:
+                if attempt > 0:
+                    delay = random.uniform(2, 5)
+                    logger.info(f"Async retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
+                    await asyncio.sleep(delay)
+
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                    response.raise_for_status()
+                    return await response.read()
+
+            except asyncio.TimeoutError:
+                logger.warning(f"Async timeout on attempt {attempt + 1}/{max_retries} for {url}")
+            except aiohttp.ClientError as e:
+                logger.warning(f"Async request failed on attempt {attempt + 1}/{max_retries}: {str(e)}")
+
         return None
 
+    async def _fetch_pages_async(self, urls: List[str]) -> Dict[str, Optional[bytes]]:
+        """Fetch multiple pages concurrently with a per-host connection cap"""
+        connector = aiohttp.TCPConnector(limit_per_host=5)
+        async with aiohttp.ClientSession(connector=connector, headers=dict(self.session.headers)) as session:
+            pages = await asyncio.gather(
+                *[self._fetch_page_async(session, url) for url in urls]
+            )
+        return dict(zip(urls, pages))
+
+    def _fetch_detail_pages(self, urls: List[str]) -> Dict[str, Dict]:
+        """Fetch and parse a batch of product pages concurrently"""
+        details_by_url = {}
+        to_fetch = []
+        for url in dict.fromkeys(urls):  # De-duplicate, preserving order
+            cached = self._detail_cache_get(url)
+            if cached is not None:
+                details_by_url[url] = cached
+            else:
+                to_fetch.append(url)
+        if not to_fetch:
+            return details_by_url
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Already inside an event loop (e.g. called from async code):
+            # asyncio.run would blow up, so fan out over threads instead.
+            # The session is thread-safe for GETs and shares the adapter pool.
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                details_by_url.update(zip(to_fetch, executor.map(self.get_book_details_from_page, to_fetch)))
+                return details_by_url
+
+        pages = asyncio.run(self._fetch_pages_async(to_fetch))
+        for url, html in pages.items():
+            if html:
+                soup = BeautifulSoup(html, _BS_PARSER, parse_only=_DETAIL_STRAINER)
+                details = self._parse_detail_page(soup)
+                details_by_url[url] = details
+                self._detail_cache_put(url, details)
+        return details_by_url
+
+    def _detail_cache_get(self, url: str) -> Optional[Dict]:
+        cached = self._detail_cache.get(url)
+        if cached is not None:
+            self._detail_cache.move_to_end(url)
+        return cached
+
+    def _detail_cache_put(self, url: str, details: Dict) -> None:
+        self._detail_cache[url] = details
+        self._detail_cache.move_to_end(url)
+        while len(self._detail_cache) > self._DETAIL_CACHE_SIZE:
+            self._detail_cache.popitem(last=False)
+
     def search_books_a_million(self, book_query: str, max_results: int = 5) -> List[Dict]:
         """Search Books-A-Million for books"""
         try:
@@ -82,49 +299,42 @@ class BooksAMillionScraper:
                 logger.error("Failed to get search results from Books-A-Million")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, _BS_PARSER)
             results = []
             
-            # Find book containers - Books-A-Million uses different selectors
-            # Try multiple possible selectors
-            book_containers = []
-            
-            # Common selectors for Books-A-Million
-            selectors_to_try = [
-                'div[class*="product-item"]',
-                'div[class*="search-result"]',
-                'div[class*="book-item"]',
-                'div[class*="product-tile"]',
-                'div[class*="item-container"]',
-                'div[data-testid*="product"]',
-                'div[class*="product-card"]',
-                'div[class*="result-item"]'
-            ]
-            
-            for selector in selectors_to_try:
-                book_containers = soup.select(selector)
-                if book_containers:
-                    logger.info(f"Found {len(book_containers)} containers using selector: {selector}")
-                    break
+            # Find book containers - Books-A-Million uses different selectors,
+            # so probe them all in a single union pass over the tree
+            book_containers = soup.select(_CONTAINER_SELECTOR)
+            if book_containers:
+                logger.info(f"Found {len(book_containers)} containers using union selector")
             
             # If no specific containers found, try more general approach
             if not book_containers:
                 # Look for containers with book-related attributes
-                book_containers = soup.find_all('div', class_=re.compile(r'product|item|result|tile|card'))
+                book_containers = soup.find_all('div', class_=_CONTAINER_CLASS_RE)
                 book_containers = [c for c in book_containers if self._looks_like_book_container(c)]
             
             logger.info(f"Found {len(book_containers)} book containers")
             
             count = 0
             for container in book_containers[:max_results * 2]:  # Get more to account for filtering
-                book_data = self.extract_book_details_bam(container, soup)
+                book_data = self.extract_book_details_bam(container, soup, fetch_details=False)
                 if book_data and count < max_results:
                     results.append(book_data)
                     count += 1
-                
-                # Add delay between extractions
-                time.sleep(random.uniform(1, 2))
-            
+
+            # Fetch all product pages in one concurrent batch, then merge
+            detail_urls = [book['URL'] for book in results if book['URL'] != "N/A"]
+            details_by_url = self._fetch_detail_pages(detail_urls)
+            for book in results:
+                detailed_info = details_by_url.get(book['URL'])
+                if detailed_info:
+                    book['Publisher'] = self.clean_text(detailed_info.get('publisher', book['Publisher']))
+                    book['Publication_Year'] = detailed_info.get('pub_year', book['Publication_Year'])
+                    book['ISBN'] = detailed_info.get('isbn', book['ISBN'])
+                    if book['Format'] == "N/A":
+                        book['Format'] = detailed_info.get('format', book['Format'])
+
             logger.info(f"Successfully extracted {len(results)} books from Books-A-Million")
             return results
             
@@ -134,18 +344,16 @@ class BooksAMillionScraper:
     
     def _looks_like_book_container(self, container) -> bool:
         """Check if a container looks like it contains book information"""
-        container_text = container.get_text().lower()
-        container_html = str(container).lower()
-        
-        # Look for book-related indicators
-        book_indicators = ['title', 'author', 'price', 'isbn', 'book', 'product']
-        
-        indicator_count = sum(1 for indicator in book_indicators 
-                            if indicator in container_text or indicator in container_html)
-        
-        return indicator_count >= 2
+        # One lowercased blob of visible text plus the container's own classes;
+        # str(container) would serialize the whole subtree just to re-scan it
+        blob = (
+            container.get_text(' ', strip=True) + ' ' + ' '.join(container.get('class', []))
+        ).lower()
+
+        # Count distinct book-related indicators in a single regex pass
+        return len(set(_INDICATOR_RE.findall(blob))) >= 2
     
-    def extract_book_details_bam(self, container, full_soup) -> Optional[Dict]:
+    def extract_book_details_bam(self, container, full_soup, fetch_details: bool = True) -> Optional[Dict]:
         """Extract book details from Books-A-Million search result container"""
         try:
             # Initialize default values
@@ -159,119 +367,62 @@ class BooksAMillionScraper:
             rating = "N/A"
             format = "N/A"
             
-            # Extract title - Try multiple approaches
-            title_elem = None
-            
-            # Try Books-A-Million specific selectors
-            title_selectors = [
-                'h3 a',
-                'h4 a',
-                'a[class*="title"]',
-                'a[class*="product-title"]',
-                'div[class*="title"] a',
-                'span[class*="title"]',
-                '[data-testid*="title"] a',
-                'a[href*="/p/"]'  # Books-A-Million product URLs often contain /p/
-            ]
-            
-            for selector in title_selectors:
-                title_elem = container.select_one(selector)
-                if title_elem:
-                    break
-            
+            # Extract title - single union probe across the BAM variants
+            title_elem = container.select_one(_TITLE_SELECTOR)
             if title_elem:
                 title = title_elem.get('title') or title_elem.get_text(strip=True)
                 # Get URL from title link
                 if title_elem.get('href'):
                     book_url = urljoin(self.base_url, title_elem['href'])
-            
+
+            # Bail out before the remaining probes (and any detail fetch)
+            # pay for a container that isn't a book card
+            if title == "Unknown Title":
+                return None
+
             # Extract author
-            author_elem = None
-            author_selectors = [
-                'span[class*="author"]',
-                'div[class*="author"]',
-                'a[class*="author"]',
-                '[data-testid*="author"]',
-                'p[class*="author"]'
-            ]
-            
-            for selector in author_selectors:
-                author_elem = container.select_one(selector)
-                if author_elem:
-                    break
-            
+            author_elem = container.select_one(_AUTHOR_SELECTOR)
             if not author_elem:
                 # Look for "by" text pattern
-                by_text = container.find(text=re.compile(r'by\s+\w+', re.I))
+                by_text = container.find(text=_BY_TEXT_RE)
                 if by_text:
                     author_elem = by_text.parent
             
             if author_elem:
                 author = author_elem.get_text(strip=True)
-                author = re.sub(r'^by\s+', '', author, flags=re.I)  # Remove "by" prefix
-            
-            # Extract price
-            price_elem = None
-            price_selectors = [
-                'span[class*="price"]',
-                'div[class*="price"]',
-                '[data-testid*="price"]',
-                'span[class*="cost"]',
-                'div[class*="cost"]'
-            ]
-            
-            for selector in price_selectors:
-                price_elem = container.select_one(selector)
-                if price_elem and '$' in price_elem.get_text():
-                    break
+                author = _BY_RE.sub('', author)  # Remove "by" prefix
             
+            # Extract price - select all candidates once, then filter for a $ amount
+            price_elem = next(
+                (p for p in container.select(_PRICE_SELECTOR) if '$' in p.get_text()),
+                None
+            )
             if price_elem:
                 price = price_elem.get_text(strip=True)
                 # Clean up price - extract just the price part
-                price_match = re.search(r'\$[\d,]+\.?\d*', price)
+                price_match = _PRICE_RE.search(price)
                 if price_match:
                     price = price_match.group()
             
             # Extract rating
-            rating_elem = None
-            rating_selectors = [
-                'span[class*="rating"]',
-                'div[class*="rating"]',
-                'div[class*="stars"]',
-                '[data-testid*="rating"]'
-            ]
-            
-            for selector in rating_selectors:
-                rating_elem = container.select_one(selector)
-                if rating_elem:
-                    break
-            
+            rating_elem = container.select_one(_RATING_SELECTOR)
             if rating_elem:
                 rating = rating_elem.get_text(strip=True)
                 # Extract numeric rating if possible
-                rating_match = re.search(r'(\d+\.?\d*)', rating)
+                rating_match = _RATING_RE.search(rating)
                 if rating_match:
                     rating = rating_match.group()
             
             # Extract format
-            format_elem = None
-            format_selectors = [
-                'span[class*="format"]',
-                'div[class*="format"]',
-                'span[class*="binding"]',
-                'div[class*="binding"]'
-            ]
-            
-            for selector in format_selectors:
-                format_elem = container.select_one(selector)
-                if format_elem:
-                    break
-            
+            format_elem = container.select_one(_FORMAT_SELECTOR)
             if format_elem:
                 format = format_elem.get_text(strip=True)
             
-            # If we have a book URL, try to get more details from the product page
-            if book_url != "N/A":
+            # Only hit the product page when a field is actually missing
+            needs_details = (
+                publisher == "Unknown Publisher" or pub_year == "Unknown" or isbn == "N/A"
+            )
+            if fetch_details and book_url != "N/A" and needs_details:
                 detailed_info = self.get_book_details_from_page(book_url)
                 if detailed_info:
                     publisher = detailed_info.get('publisher', publisher)
@@ -284,11 +435,7 @@ class BooksAMillionScraper:
             title = self.clean_text(title)
             author = self.clean_text(author)
             publisher = self.clean_text(publisher)
-            
-            # Skip if we don't have meaningful data
-            if title == "Unknown Title" and author == "Unknown Author":
-                return None
-            
+
             return {
                 "Site": "Books-A-Million",
                 "Title": title,
@@ -308,74 +455,94 @@ class BooksAMillionScraper:
     
     def get_book_details_from_page(self, book_url: str) -> Optional[Dict]:
         """Get additional book details from individual product page"""
+        cached = self._detail_cache_get(book_url)
+        if cached is not None:
+            return cached
+
         try:
             response = self.make_request_with_retry(book_url, timeout=15)
             if not response:
                 return None
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            details = {}
-            
+
+            soup = BeautifulSoup(response.content, _BS_PARSER, parse_only=_DETAIL_STRAINER)
+            details = self._parse_detail_page(soup)
+            self._detail_cache_put(book_url, details)
+            return details
+
+        except Exception as e:
+            logger.error(f"Error getting book details from page {book_url}: {str(e)}")
+            return None
+
+    @staticmethod
+    def _assign_spec_field(details: Dict, key: str, value: str) -> None:
+        """Route one spec key/value pair into the details dict"""
+        if not key:
+            return
+        if 'publisher' in key:
+            details['publisher'] = value
+        elif 'publication' in key or 'publish' in key:
+            year_match = _YEAR_RE.search(value)
+            if year_match:
+                details['pub_year'] = year_match.group()
+        elif 'isbn' in key:
+            isbn_match = _ISBN_RE.search(value)
+            if isbn_match:
+                details['isbn'] = isbn_match.group()
+        elif 'format' in key or 'binding' in key:
+            details['format'] = value
+
+    def _parse_detail_page(self, soup) -> Dict:
+        """Extract publisher/year/ISBN/format from a parsed product page"""
+        details = {}
+        try:
+
             # Look for product details in various sections
             # Try to find structured product information
             
             # Method 1: Look for product details table/list
-            details_section = soup.find('div', class_=re.compile(r'product-details|book-details|item-details'))
+            details_section = soup.select_one(
+                'div[class*="product-details"], div[class*="book-details"], div[class*="item-details"]'
+            )
             if details_section:
                 # Look for key-value pairs in dt/dd format
                 for dt in details_section.find_all('dt'):
                     dt_text = dt.get_text(strip=True).lower()
                     dd = dt.find_next_sibling('dd')
                     if dd:
-                        dd_text = dd.get_text(strip=True)
-                        
-                        if 'publisher' in dt_text:
-                            details['publisher'] = dd_text
-                        elif 'publication' in dt_text or 'publish' in dt_text:
-                            year_match = re.search(r'\d{4}', dd_text)
-                            if year_match:
-                                details['pub_year'] = year_match.group()
-                        elif 'isbn' in dt_text:
-                            isbn_match = re.search(r'[\d-]{10,17}', dd_text)
-                            if isbn_match:
-                                details['isbn'] = isbn_match.group()
-                        elif 'format' in dt_text or 'binding' in dt_text:
-                            details['format'] = dd_text
+                        self._assign_spec_field(details, dt_text, dd.get_text(strip=True))
             
             # Method 2: Look for structured data in meta tags or JSON-LD
             json_ld = soup.find('script', {'type': 'application/ld+json'})
             if json_ld:
                 try:
-                    data = json.loads(json_ld.string)
+                    # orjson rejects bs4's str subclass; feed it bytes
+                    data = _json_loads(json_ld.string.encode() if isinstance(json_ld.string, str) else json_ld.string)
                     if isinstance(data, dict):
                         if 'publisher' in data:
                             details['publisher'] = data['publisher']
                         if 'datePublished' in data:
-                            year_match = re.search(r'\d{4}', data['datePublished'])
+                            year_match = _YEAR_RE.search(data['datePublished'])
                             if year_match:
                                 details['pub_year'] = year_match.group()
                         if 'isbn' in data:
                             details['isbn'] = data['isbn']
                         if 'bookFormat' in data:
                             details['format'] = data['bookFormat']
-                except json.JSONDecodeError:
+                except ValueError:  # orjson.JSONDecodeError and json's both subclass this
                     pass
             
-            # Method 3: Look for specific meta tags
-            meta_tags = soup.find_all('meta')
-            for meta in meta_tags:
-                if meta.get('name') == 'book:author':
-                    # Sometimes author info is in meta tags
-                    continue
-                elif meta.get('property') == 'book:isbn':
+            # Method 3: Look for specific meta tags - target just the book:*
+            # properties instead of scanning every meta element on the page
+            for meta in soup.select('meta[property="book:isbn"], meta[property="book:release_date"]'):
+                if meta.get('property') == 'book:isbn':
                     details['isbn'] = meta.get('content', '')
-                elif meta.get('property') == 'book:release_date':
-                    year_match = re.search(r'\d{4}', meta.get('content', ''))
+                else:
+                    year_match = _YEAR_RE.search(meta.get('content', ''))
                     if year_match:
                         details['pub_year'] = year_match.group()
             
             # Method 4: Look for product specifications in a table
-            spec_table = soup.find('table', class_=re.compile(r'spec|detail|product'))
+            spec_table = soup.find('table', class_=_SPEC_CLASS_RE)
             if spec_table:
                 rows = spec_table.find_all('tr')
                 for row in rows:
@@ -383,25 +550,13 @@ class BooksAMillionScraper:
                     if len(cells) >= 2:
                         key = cells[0].get_text(strip=True).lower()
                         value = cells[1].get_text(strip=True)
-                        
-                        if 'publisher' in key:
-                            details['publisher'] = value
-                        elif 'publication' in key or 'publish' in key:
-                            year_match = re.search(r'\d{4}', value)
-                            if year_match:
-                                details['pub_year'] = year_match.group()
-                        elif 'isbn' in key:
-                            isbn_match = re.search(r'[\d-]{10,17}', value)
-                            if isbn_match:
-                                details['isbn'] = isbn_match.group()
-                        elif 'format' in key or 'binding' in key:
-                            details['format'] = value
-            
+                        self._assign_spec_field(details, key, value)
+
             return details
-            
+
         except Exception as e:
-            logger.error(f"Error getting book details from page {book_url}: {str(e)}")
-            return None
+            logger.error(f"Error parsing product page details: {str(e)}")
+            return details
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text"""
@@ -409,13 +564,13 @@ class BooksAMillionScraper:
             return "Unknown"
         
         # Remove extra whitespace and newlines
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WS_RE.sub(' ', text).strip()
         
         # Remove common prefixes
-        text = re.sub(r'^(by\s+)', '', text, flags=re.I)
+        text = _BY_RE.sub('', text)
         
         # Remove HTML entities
-        text = re.sub(r'&[a-zA-Z0-9#]+;', '', text)
+        text = _ENTITY_RE.sub('', text)
         
         return text if text else "Unknown"
     
@@ -433,12 +588,16 @@ class BooksAMillionScraper:
         if not data:
             logger.warning("No data to save")
             return
-        
+
+        # Lazy import: CSV-only callers never pay the pandas startup cost
+        import pandas as pd
+
         df = pd.DataFrame(data)
         #df["Date_Scraped"] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
-        
+
         try:
-            df.to_excel(filename, index=False)
+            # xlsxwriter is much faster than openpyxl for flat write-only sheets
+            df.to_excel(filename, index=False, engine='xlsxwriter')
             logger.info(f"Data saved to {filename}")
             logger.info(f"Total books found: {len(df)}")
             
@@ -455,17 +614,35 @@ class BooksAMillionScraper:
         except Exception as e:
             logger.error(f"Error saving to Excel: {str(e)}")
 
+    def save_to_parquet(self, data: List[Dict], filename: str = "books_a_million_books.parquet") -> None:
+        """Save book data to Parquet for fast machine-readable output"""
+        if not data:
+            logger.warning("No data to save")
+            return
+
+        # Lazy import: CSV-only callers never pay the pandas startup cost
+        import pandas as pd
+
+        try:
+            # Columnar binary via pyarrow - far cheaper than Excel when no
+            # human needs to open the file
+            pd.DataFrame(data).to_parquet(filename, index=False)
+            logger.info(f"Data saved to {filename}")
+        except Exception as e:
+            logger.error(f"Error saving to Parquet: {str(e)}")
+
     def save_to_csv(self, data: List[Dict], filename: str = "books_a_million_books.csv") -> None:
-        """Save book data to CSV"""
+        """Save book data to CSV, streaming one row at a time"""
         if not data:
             logger.warning("No data to save")
             return
-        
-        df = pd.DataFrame(data)
-        #df["Date_Scraped"] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
-        
+
         try:
-            df.to_csv(filename, index=False)
+            # csv.DictWriter streams rows without building a DataFrame first
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=list(data[0].keys()), extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(data)
             logger.info(f"Data saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving to CSV: {str(e)}")
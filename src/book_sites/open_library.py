@@ -1,12 +1,19 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
 import time
 import logging
-from urllib.parse import urljoin, quote_plus
-import re
+from urllib.parse import quote_plus
 from typing import List, Dict, Optional
 import random
+import json
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+    _json_loads = json.loads
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,6 +28,14 @@ class BookScraper:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15"
         ]
+        # Keep-alive pool for repeated openlibrary.org API calls
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.update_headers()
     
     def update_headers(self):
@@ -37,8 +52,9 @@ class BookScraper:
         """Make HTTP request with retry logic and error handling"""
         for attempt in range(max_retries):
             try:
-                self.update_headers()
                 if attempt > 0:
+                    # Only re-roll the user agent when the previous attempt failed
+                    self.update_headers()
                     delay = random.uniform(2, 5)
                     logger.info(f"Retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
                     time.sleep(delay)
@@ -72,7 +88,9 @@ class BookScraper:
             if not response:
                 return []
             
-            data = response.json()
+            # Decode straight from the raw bytes, skipping requests' charset
+            # detection and the slower stdlib json path
+            data = _json_loads(response.content)
             results = []
             
             if 'docs' in data:  # Search API response
@@ -93,7 +111,39 @@ class BookScraper:
         except Exception as e:
             logger.error(f"Error searching Open Library: {str(e)}")
             return []
-    
+
+    def search_open_library_bulk(self, isbns: List[str]) -> List[Dict]:
+        """Look up multiple ISBNs in a single Books API request"""
+        if not isbns:
+            return []
+        try:
+            # The Books API accepts comma-separated bibkeys, so N ISBNs cost
+            # one round-trip instead of N
+            bibkeys = ','.join(f"ISBN:{isbn}" for isbn in isbns)
+            api_url = f"https://openlibrary.org/api/books?bibkeys={bibkeys}&format=json&jscmd=data"
+
+            logger.info(f"Bulk searching Open Library for {len(isbns)} ISBNs")
+
+            response = self.make_request_with_retry(api_url, timeout=15)
+            if not response:
+                return []
+
+            data = _json_loads(response.content)
+            results = []
+
+            for bibkey, book_info in data.items():
+                isbn = bibkey.split(':', 1)[-1]
+                book_data = self.extract_book_details_ol_isbn(book_info, isbn)
+                if book_data:
+                    results.append(book_data)
+
+            logger.info(f"Found {len(results)} books from Open Library bulk lookup")
+            return results
+
+        except Exception as e:
+            logger.error(f"Error bulk searching Open Library: {str(e)}")
+            return []
+
     def extract_book_details_ol(self, book_data: Dict) -> Optional[Dict]:
         """Extract book details from Open Library search API response"""
         try:
@@ -164,3 +214,17 @@ class BookScraper:
         except Exception as e:
             logger.error(f"Error saving to Excel: {str(e)}")
 
+    def save_to_parquet(self, data: List[Dict], filename: str = "book_results.parquet") -> None:
+        """Save book data to Parquet for fast machine-readable output"""
+        if not data:
+            logger.warning("No data to save")
+            return
+
+        try:
+            # Columnar binary via pyarrow - far cheaper than Excel when no
+            # human needs to open the file
+            pd.DataFrame(data).to_parquet(filename, index=False)
+            logger.info(f"Data saved to {filename}")
+        except Exception as e:
+            logger.error(f"Error saving to Parquet: {str(e)}")
+
@@ -1,14 +1,24 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+import asyncio
 import time
 import logging
 from urllib.parse import urljoin, quote_plus, urlparse
 import re
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Optional
 import random
 import json
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is in requirements
+    _json_loads = json.loads
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -20,8 +30,158 @@ from selenium.webdriver.chrome.options import Options
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Only materialize the parts of each page the extractors actually read.
+# Search pages: the candidate result containers plus <title> for logging.
+_CONTAINER_CLASS_RE = re.compile(
+    r'SearchResultListItem|AllEditionsItem|bookItem|book-item|product-item|item.*book|result.*item'
+)
+_TESTID_RE = re.compile(r'book|item')
+
+
+def _search_match(name, attrs):
+    if name in ('article', 'title'):
+        return True
+    if name == 'div':
+        cls = attrs.get('class', '')
+        if isinstance(cls, list):
+            cls = ' '.join(cls)
+        if cls and _CONTAINER_CLASS_RE.search(cls):
+            return True
+        testid = attrs.get('data-testid', '')
+        return bool(testid and _TESTID_RE.search(testid))
+    return False
+
+
+_SEARCH_STRAINER = SoupStrainer(_search_match)
+
+# Product pages: the WorkMeta/details/publication sections plus meta tags
+# and JSON-LD scripts
+_DETAIL_CLASS_RE = re.compile(
+    r'WorkMeta-EditionInfoContainer|book-details|product-details|publication-info'
+)
+
+
+def _detail_match(name, attrs):
+    if name in ('meta', 'script'):
+        return True
+    if name == 'div':
+        cls = attrs.get('class', '')
+        if isinstance(cls, list):
+            cls = ' '.join(cls)
+        return bool(cls and _DETAIL_CLASS_RE.search(cls))
+    return False
+
+
+_DETAIL_STRAINER = SoupStrainer(_detail_match)
+
+# Compiled once at import; several of these run per container or per spec row
+_RE_PRICE = re.compile(r'\$[\d.]+')
+_RE_STAR = re.compile(r'(\d+\.?\d*)\s*(?:out of|/)\s*5')
+_RE_YEAR = re.compile(r'\d{4}')
+_RE_YEAR_FULL = re.compile(r'\b(19|20)\d{2}\b')
+_RE_ISBN = re.compile(r'[\d-]{10,17}')
+_RE_BY_PREFIX = re.compile(r'^by\s+', re.I)
+_RE_WS = re.compile(r'\s+')
+_RE_DETAILS_CLS = re.compile(r'book-details|product-details')
+_RE_PUB_INFO_CLS = re.compile(r'publication-info')
+_RE_PUBLISHER_COMMA = re.compile(r'([^,]+?)(?:,\s*\d{4})')
+
+# Per-field union selectors: one comma-separated probe per field means a
+# single subtree traversal instead of a cascade of fallback walks
+_TITLE_SELECTOR = ', '.join((
+    'a.AllEditionsItem-tile-title',
+    'h3 a',
+    'h2 a',
+    'h4 a',
+    '.title a',
+    '.book-title a',
+    'a[href*="/w/"]',  # ThriftBooks book URLs contain /w/
+    'a[title]'
+))
+_AUTHOR_SELECTOR = ', '.join((
+    'div.SearchResultListItem-bottomSpacing.SearchResultListItem-subheading a[itemprop="author"]',
+    'a[itemprop="author"]'
+))
+_PRICE_SELECTOR = ', '.join((
+    '.SearchResultListItem-price',
+    '.price',
+    '[class*="price"]',
+    '[class*="cost"]'
+))
+_CONDITION_SELECTOR = '[class*="condition"], .condition'
+_FORMAT_SELECTOR = ', '.join((
+    '[class*="format"]',
+    '[class*="binding"]',
+    '.format',
+    '.binding'
+))
+_RATING_SELECTOR = ', '.join((
+    '[class*="rating"]',
+    '[class*="stars"]',
+    '.rating',
+    '.stars'
+))
+
+# Container probes in order of preference, built once instead of per search
+_CONTAINER_SELECTORS = (
+    ('div', {'class': 'SearchResultListItem'}),
+    ('div', {'class': re.compile(r'AllEditionsItem')}),
+    ('div', {'class': re.compile(r'bookItem')}),
+    ('div', {'class': re.compile(r'book-item')}),
+    ('div', {'class': re.compile(r'product-item')}),
+    ('div', {'class': re.compile(r'item.*book')}),
+    ('div', {'class': re.compile(r'result.*item')}),
+    ('article', {}),
+    ('div', {'data-testid': re.compile(r'book|item')}),
+)
+
+class _TokenBucket:
+    """Token-bucket limiter: bursts run at full speed, sustained traffic
+    is paced at `rate` requests per second"""
+
+    def __init__(self, rate: float = 1.0, burst: int = 5):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1:
+            wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            self.tokens = 0.0
+        else:
+            self.tokens -= 1
+
+
+def _fast_text(elem) -> str:
+    """Whitespace-normalized text, taking the cheap .string path on leaf
+    elements instead of get_text's full descendant walk"""
+    text = elem.string
+    if text is None:
+        text = elem.get_text(' ', strip=True)
+    return _RE_WS.sub(' ', text).strip()
+
+
+_dns_cache_installed = False
+
+
+def _install_dns_cache():
+    """Memoize socket.getaddrinfo so repeat connections to the same host
+    skip the resolver round-trip; glibc does not cache this by default"""
+    global _dns_cache_installed
+    if _dns_cache_installed:
+        return
+    socket.getaddrinfo = lru_cache(maxsize=32)(socket.getaddrinfo)
+    _dns_cache_installed = True
+
+
 class ThriftBooksBookScraper:
     def __init__(self):
+        _install_dns_cache()
         self.session = requests.Session()
         self.driver = None
         self.base_url = "https://www.thriftbooks.com"
@@ -34,31 +194,24 @@ class ThriftBooksBookScraper:
             "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36"
         ]
         
-        # Initialize headers
+        # Keep-alive pool for the same-host search + product-page traffic.
+        # Pooling only: make_request_with_retry owns the retries, the 429
+        # Retry-After handling and the Selenium fallback, and adapter-level
+        # retries would stack multiplicatively underneath that loop
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=0
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Static header block, set once; only the user agent rotates
         self.headers = {
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Referer': 'https://www.google.com/',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'cross-site',
-            'Pragma': 'no-cache',
-            'Cache-Control': 'no-cache',
-        }
-        
-        # Update headers with random user agent
-        self.update_headers()
-    
-    def update_headers(self):
-        """Update headers with random user agent and ThriftBooks-specific headers"""
-        self.headers.update({
-            "User-Agent": random.choice(self.user_agents),
             "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
             "Accept-Language": "en-US,en;q=0.9",
             "Accept-Encoding": "gzip, deflate, br",
+            "Referer": "https://www.google.com/",
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1",
             "Sec-Fetch-Dest": "document",
@@ -70,11 +223,21 @@ class ThriftBooksBookScraper:
             "Sec-CH-UA": '"Not A(Brand";v="99", "Google Chrome";v="121", "Chromium";v="121"',
             "Sec-CH-UA-Mobile": "?0",
             "Sec-CH-UA-Platform": '"Windows"'
-        })
-        
-        # Update session headers
+        }
         self.session.headers.update(self.headers)
-        
+        self._limiter = _TokenBucket(rate=1.0, burst=5)
+        self._session_primed = False
+        # Parsed product-page details keyed by URL; the same book resurfaces
+        # across ISBN and title searches within one process
+        self._detail_cache: Dict[str, Optional[Dict]] = {}
+        self.update_headers()
+
+    def update_headers(self):
+        """Rotate just the user agent; the rest of the header block is static"""
+        user_agent = random.choice(self.user_agents)
+        self.headers["User-Agent"] = user_agent
+        self.session.headers["User-Agent"] = user_agent
+
     def setup_selenium_driver(self):
         """Setup Selenium WebDriver with proper configuration"""
         if self.driver:
@@ -99,13 +262,26 @@ class ThriftBooksBookScraper:
         """Make HTTP request with retry logic and error handling"""
         for attempt in range(max_retries):
             try:
-                self.update_headers()
                 if attempt > 0:
+                    # Only re-roll the user agent when the previous attempt failed
+                    self.update_headers()
                     delay = random.uniform(3, 7)
                     logger.info(f"Retry {attempt + 1}/{max_retries} after {delay:.1f}s delay")
                     time.sleep(delay)
 
+                # Pace the actual HTTP traffic; CPU-only work stays unthrottled
+                self._limiter.acquire()
                 response = self.session.get(url, timeout=timeout)
+                if response.status_code == 429:
+                    # Honor the server's Retry-After, fall back to exponential
+                    retry_after = response.headers.get('Retry-After')
+                    if retry_after and retry_after.isdigit():
+                        delay = min(int(retry_after), 60)
+                    else:
+                        delay = 2 ** (attempt + 1)
+                    logger.warning(f"Rate limited (429); backing off {delay}s")
+                    time.sleep(delay)
+                    continue
                 response.raise_for_status()
                 return response
                 
@@ -152,31 +328,29 @@ class ThriftBooksBookScraper:
                 self.driver.quit()
                 self.driver = None
 
-    def search_thriftbooks(self, book_query: str, max_results: int = 5) -> List[Dict]:
+    def search_thriftbooks(self, book_query: str, max_results: int = 5, fetch_details: bool = True) -> List[Dict]:
         """Search ThriftBooks for books"""
         try:
-            # First, visit the homepage to establish session
-            logger.info("Establishing session with ThriftBooks...")
-            home_response = self.make_request_with_retry(self.base_url, timeout=15)
-            if not home_response:
-                logger.error("Failed to establish session with ThriftBooks")
-                return []
-            
-            # Add a small delay
-            time.sleep(random.uniform(1, 3))
-            
             # Construct search URL
             search_url = f"{self.search_url}?b.search={quote_plus(book_query)}"
-            
+
             logger.info(f"Searching ThriftBooks for: {book_query}")
             logger.info(f"Search URL: {search_url}")
-            
+
             response = self.make_request_with_retry(search_url, timeout=20)
+            if not response and not self._session_primed:
+                # ThriftBooks sometimes wants the homepage cookies first; prime
+                # the session lazily and retry once rather than paying the
+                # homepage transfer on every search
+                logger.info("Priming session with ThriftBooks homepage...")
+                self._session_primed = True
+                if self.make_request_with_retry(self.base_url, timeout=15):
+                    response = self.make_request_with_retry(search_url, timeout=20)
             if not response:
                 logger.error("Failed to get search results from ThriftBooks")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_SEARCH_STRAINER)
             results = []
             
             # Debug: Print some of the page content to understand structure
@@ -187,9 +361,10 @@ class ThriftBooksBookScraper:
             book_containers = self.find_book_containers(soup)
             
             if not book_containers:
-                # Check if we're being blocked or redirected
-                page_text = soup.get_text().lower()
-                if any(keyword in page_text for keyword in ["access denied", "blocked", "captcha", "please verify"]):
+                # Check if we're being blocked or redirected - a raw byte scan
+                # beats walking the tree for text on a page we're discarding
+                raw = response.content.lower()
+                if any(keyword in raw for keyword in (b"access denied", b"blocked", b"captcha", b"please verify")):
                     logger.error("Access appears to be blocked by ThriftBooks")
                 else:
                     logger.warning("No book containers found. Page structure may have changed.")
@@ -199,39 +374,68 @@ class ThriftBooksBookScraper:
             
             count = 0
             for container in book_containers[:max_results * 2]:  # Get more to account for filtering
-                book_data = self.extract_book_details_tb(container, soup)
+                book_data = self.extract_book_details_tb(container, soup, fetch_details=False)
                 if book_data and count < max_results:
                     results.append(book_data)
                     count += 1
-                
-                # Add delay between extractions
-                time.sleep(random.uniform(0.5, 1.5))
-            
+
+            # Fan the independent product-page fetches out over threads;
+            # the pooled Session is thread-safe for GETs. Books the search
+            # page already describes fully never earn a product-page trip.
+            detail_urls = []
+            if fetch_details:
+                detail_urls = list(dict.fromkeys(
+                    book['URL'] for book in results
+                    if book['URL'] != "N/A" and "http" in book['URL']
+                    and (book['Publisher'] == "Unknown Publisher"
+                         or book['Publication_Year'] == "Unknown"
+                         or book['ISBN'] == "N/A")
+                ))
+            details_by_url = {}
+            if detail_urls:
+                with ThreadPoolExecutor(max_workers=min(max_results, 8)) as executor:
+                    details_by_url = dict(zip(
+                        detail_urls,
+                        executor.map(self.get_book_details_from_page, detail_urls)
+                    ))
+            for book in results:
+                detailed_info = details_by_url.get(book['URL'])
+                if detailed_info:
+                    book['Publisher'] = self.clean_text(detailed_info.get('publisher', book['Publisher']))
+                    book['Publication_Year'] = detailed_info.get('pub_year', book['Publication_Year'])
+                    book['ISBN'] = detailed_info.get('isbn', book['ISBN'])
+                    if book['Format'] == "N/A":
+                        book['Format'] = detailed_info.get('format', book['Format'])
+
             logger.info(f"Successfully extracted {len(results)} books from ThriftBooks")
             return results
             
         except Exception as e:
             logger.error(f"Error searching ThriftBooks: {str(e)}")
             return []
-    
+
+    async def _search_async(self, queries: List[str], max_results: int = 5, concurrency: int = 8) -> List[List[Dict]]:
+        """Run several blocking searches in worker threads with bounded concurrency"""
+        # The searches stay on the pooled (thread-safe) Session, so threads
+        # via asyncio.to_thread give the overlap without a separate client
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def guarded(query: str) -> List[Dict]:
+            async with semaphore:
+                return await asyncio.to_thread(self.search_thriftbooks, query, max_results)
+
+        return list(await asyncio.gather(*[guarded(query) for query in queries]))
+
+    def search_many(self, queries: List[str], max_results: int = 5, concurrency: int = 8) -> List[List[Dict]]:
+        """Search multiple queries concurrently; returns one result list per query"""
+        return asyncio.run(self._search_async(queries, max_results, concurrency))
+
     def find_book_containers(self, soup):
         """Find book containers using multiple selector strategies"""
         book_containers = []
         
         # Try different selectors in order of preference
-        selectors = [
-            ('div', {'class': 'SearchResultListItem'}),
-            ('div', {'class': re.compile(r'AllEditionsItem')}),
-            ('div', {'class': re.compile(r'bookItem')}),
-            ('div', {'class': re.compile(r'book-item')}),
-            ('div', {'class': re.compile(r'product-item')}),
-            ('div', {'class': re.compile(r'item.*book')}),
-            ('div', {'class': re.compile(r'result.*item')}),
-            ('article', {}),
-            ('div', {'data-testid': re.compile(r'book|item')}),
-        ]
-        
-        for tag, attrs in selectors:
+        for tag, attrs in _CONTAINER_SELECTORS:
             book_containers = soup.find_all(tag, attrs)
             if book_containers:
                 logger.info(f"Found {len(book_containers)} books using {tag} with {attrs}")
@@ -239,7 +443,7 @@ class ThriftBooksBookScraper:
         
         return book_containers
     
-    def extract_book_details_tb(self, container, full_soup) -> Optional[Dict]:
+    def extract_book_details_tb(self, container, full_soup, fetch_details: bool = True) -> Optional[Dict]:
         """Extract book details from ThriftBooks search result container"""
         try:
             # Initialize default values
@@ -272,8 +476,11 @@ class ThriftBooksBookScraper:
             # Extract rating
             rating = self.extract_rating(container)
             
-            # If we have a book URL, try to get more details from the product page
-            if book_url != "N/A" and "http" in book_url:
+            # If the search result left gaps, try to fill them from the product page
+            missing = (publisher == "Unknown Publisher"
+                       or pub_year == "Unknown"
+                       or isbn == "N/A")
+            if fetch_details and missing and book_url != "N/A" and "http" in book_url:
                 detailed_info = self.get_book_details_from_page(book_url)
                 if detailed_info:
                     publisher = detailed_info.get('publisher', publisher)
@@ -312,34 +519,18 @@ class ThriftBooksBookScraper:
         title = "Unknown Title"
         book_url = "N/A"
         
-        # Try multiple selectors for title
-        title_selectors = [
-            'a.AllEditionsItem-tile-title',
-            'h3 a',
-            'h2 a', 
-            'h4 a',
-            '.title a',
-            '.book-title a',
-            'a[href*="/w/"]',  # ThriftBooks book URLs contain /w/
-            'a[title]'
-        ]
-        
-        title_elem = None
-        for selector in title_selectors:
-            title_elem = container.select_one(selector)
-            if title_elem:
-                break
-        
+        # Single union probe over the known title shapes
+        title_elem = container.select_one(_TITLE_SELECTOR)
         if not title_elem:
             # Fallback: find any link that looks like a book title
             links = container.find_all('a', href=True)
             for link in links:
-                if '/w/' in link.get('href', '') or link.get_text(strip=True):
+                if '/w/' in link.get('href', '') or _fast_text(link):
                     title_elem = link
                     break
         
         if title_elem:
-            title = title_elem.get_text(strip=True)
+            title = _fast_text(title_elem)
             href = title_elem.get('href')
             if href:
                 book_url = urljoin(self.base_url, href)
@@ -350,16 +541,11 @@ class ThriftBooksBookScraper:
         """Extract author from container"""
         author = "Unknown Author"
 
-        # Try to find the specific ThriftBooks author container
-        author_elem = container.find(
-            "div",
-            class_="SearchResultListItem-bottomSpacing SearchResultListItem-subheading"
-        )
-        if author_elem:
-            author_link = author_elem.find("a", itemprop="author")
-            if author_link:
-                author = author_link.get_text(strip=True)
-                return author
+        # Prefer the itemprop link inside the ThriftBooks subheading, falling
+        # back to any author-tagged link, in one traversal
+        author_link = container.select_one(_AUTHOR_SELECTOR)
+        if author_link:
+            author = _fast_text(author_link)
 
         return author
     
@@ -367,100 +553,71 @@ class ThriftBooksBookScraper:
         """Extract price from container"""
         price = "N/A"
         
-        price_selectors = [
-            '.SearchResultListItem-price',
-            '.price',
-            '[class*="price"]',
-            '[class*="cost"]'
-        ]
-        
-        for selector in price_selectors:
-            price_elem = container.select_one(selector)
-            if price_elem:
-                price_text = price_elem.get_text(strip=True)
-                # Extract price using regex
-                price_match = re.search(r'\$[\d.]+', price_text)
-                if price_match:
-                    price = price_match.group()
-                    break
-                elif price_text:
-                    price = price_text
-                    break
-        
+        for price_elem in container.select(_PRICE_SELECTOR):
+            price_text = _fast_text(price_elem)
+            # Extract price using regex
+            price_match = _RE_PRICE.search(price_text)
+            if price_match:
+                price = price_match.group()
+                break
+            elif price_text:
+                price = price_text
+                break
+
         return price
     
     def extract_condition(self, container):
         """Extract condition from container"""
         condition = "N/A"
         
-        condition_selectors = [
-            '[class*="condition"]',
-            '.condition'
-        ]
-        
-        for selector in condition_selectors:
-            condition_elem = container.select_one(selector)
-            if condition_elem:
-                condition = condition_elem.get_text(strip=True)
-                if condition:
-                    break
-        
+        condition = next(
+            (text for elem in container.select(_CONDITION_SELECTOR)
+             if (text := _fast_text(elem))),
+            condition
+        )
+
         return condition
     
     def extract_format(self, container):
         """Extract format from container"""
         format = "N/A"
         
-        format_selectors = [
-            '[class*="format"]',
-            '[class*="binding"]',
-            '.format',
-            '.binding'
-        ]
-        
-        for selector in format_selectors:
-            format_elem = container.select_one(selector)
-            if format_elem:
-                format = format_elem.get_text(strip=True)
-                if format:
-                    break
-        
+        format = next(
+            (text for elem in container.select(_FORMAT_SELECTOR)
+             if (text := _fast_text(elem))),
+            format
+        )
+
         return format
     
     def extract_rating(self, container):
         """Extract rating from container"""
         rating = "N/A"
         
-        rating_selectors = [
-            '[class*="rating"]',
-            '[class*="stars"]',
-            '.rating',
-            '.stars'
-        ]
-        
-        for selector in rating_selectors:
-            rating_elem = container.select_one(selector)
-            if rating_elem:
-                rating_text = rating_elem.get_text(strip=True)
-                # Look for star ratings or numeric ratings
-                star_match = re.search(r'(\d+\.?\d*)\s*(?:out of|/)\s*5', rating_text)
-                if star_match:
-                    rating = f"{star_match.group(1)}/5"
-                    break
-                elif rating_text:
-                    rating = rating_text
-                    break
-        
+        for rating_elem in container.select(_RATING_SELECTOR):
+            rating_text = _fast_text(rating_elem)
+            # Look for star ratings or numeric ratings
+            star_match = _RE_STAR.search(rating_text)
+            if star_match:
+                rating = f"{star_match.group(1)}/5"
+                break
+            elif rating_text:
+                rating = rating_text
+                break
+
         return rating
     
     def get_book_details_from_page(self, book_url: str) -> Optional[Dict]:
         """Get additional book details from individual product page"""
+        if book_url in self._detail_cache:
+            return self._detail_cache[book_url]
+
         try:
             response = self.make_request_with_retry(book_url, timeout=15)
             if not response:
                 return None
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_DETAIL_STRAINER)
             details = {}
 
             # Look for new ThriftBooks details section
@@ -468,22 +625,18 @@ class ThriftBooksBookScraper:
             if edition_info:
                 details_rows = edition_info.select('.WorkMeta-detailsRow')
                 for row in details_rows:
-                    # Check for ISBN13 using the specific span
-                    isbn13_title = row.find('span', class_='WorkMeta-detail WorkMeta-detailTitle')
-                    if isbn13_title and isbn13_title.get_text(strip=True).lower() == 'isbn13:':
-                        isbn13_value = row.find('span', class_='WorkMeta-detail WorkMeta-detailValue')
-                        if isbn13_value:
-                            details['isbn'] = isbn13_value.get_text(strip=True)
+                    # One title/value lookup per row; the isbn13: branch below
+                    # covers what the old duplicate span probe re-extracted
                     title_elem = row.select_one('.WorkMeta-detailTitle')
                     value_elem = row.select_one('.WorkMeta-detailValue')
                     if not title_elem or not value_elem:
                         continue
-                    key = title_elem.get_text(strip=True).lower()
-                    value = value_elem.get_text(strip=True)
+                    key = _fast_text(title_elem).lower()
+                    value = _fast_text(value_elem)
                     if 'publisher' in key:
                         details['publisher'] = value
                     elif 'release date' in key or 'published' in key:
-                        year_match = re.search(r'\b(19|20)\d{2}\b', value)
+                        year_match = _RE_YEAR_FULL.search(value)
                         if year_match:
                             details['pub_year'] = year_match.group()
                     elif key == 'isbn13:' and value:
@@ -496,76 +649,86 @@ class ThriftBooksBookScraper:
             # Fallback to previous logic if needed
             if not details:
                 # Look for book details section
-                details_section = soup.find('div', class_=re.compile(r'book-details|product-details'))
+                details_section = soup.find('div', class_=_RE_DETAILS_CLS)
                 if details_section:
-                    for dt in details_section.find_all('dt'):
-                        dt_text = dt.get_text(strip=True).lower()
-                        dd = dt.find_next_sibling('dd')
-                        if dd:
-                            dd_text = dd.get_text(strip=True)
-                            if 'publisher' in dt_text:
-                                details['publisher'] = dd_text
-                            elif 'publication' in dt_text or 'published' in dt_text:
-                                year_match = re.search(r'\d{4}', dd_text)
-                                if year_match:
-                                    details['pub_year'] = year_match.group()
-                            elif 'isbn' in dt_text:
-                                isbn_match = re.search(r'[\d-]{10,17}', dd_text)
-                                if isbn_match:
-                                    details['isbn'] = isbn_match.group()
-                            elif 'format' in dt_text or 'binding' in dt_text:
-                                details['format'] = dd_text
-
-            # Look for meta tags with book information
-            meta_tags = soup.find_all('meta', attrs={'property': re.compile(r'book:|og:')})
-            for meta in meta_tags:
-                property_name = meta.get('property', '').lower()
-                content = meta.get('content', '')
-                if 'book:author' in property_name:
-                    details['author'] = content
-                elif 'book:isbn' in property_name:
-                    details['isbn'] = content
-                elif 'book:release_date' in property_name:
-                    year_match = re.search(r'\d{4}', content)
-                    if year_match:
-                        details['pub_year'] = year_match.group()
+                    # One traversal collects the whole definition list; the
+                    # dt/dd pairs fall out of zipping the even and odd slices
+                    children = details_section.find_all(['dt', 'dd'])
+                    for dt, dd in zip(children[0::2], children[1::2]):
+                        if dt.name != 'dt' or dd.name != 'dd':
+                            continue
+                        dt_text = _fast_text(dt).lower()
+                        dd_text = _fast_text(dd)
+                        if 'publisher' in dt_text:
+                            details['publisher'] = dd_text
+                        elif 'publication' in dt_text or 'published' in dt_text:
+                            year_match = _RE_YEAR.search(dd_text)
+                            if year_match:
+                                details['pub_year'] = year_match.group()
+                        elif 'isbn' in dt_text:
+                            isbn_match = _RE_ISBN.search(dd_text)
+                            if isbn_match:
+                                details['isbn'] = isbn_match.group()
+                        elif 'format' in dt_text or 'binding' in dt_text:
+                            details['format'] = dd_text
+
+            # Look for meta tags with book information: one pass builds a
+            # property->content table, then plain dict lookups
+            meta_by_prop = {
+                m.get('property', '').lower(): m.get('content', '')
+                for m in soup.select('meta[property^="book:"]')
+            }
+            if meta_by_prop.get('book:author'):
+                details['author'] = meta_by_prop['book:author']
+            if meta_by_prop.get('book:isbn'):
+                details['isbn'] = meta_by_prop['book:isbn']
+            release_date = meta_by_prop.get('book:release_date', '')
+            if release_date:
+                year_match = _RE_YEAR.search(release_date)
+                if year_match:
+                    details['pub_year'] = year_match.group()
 
             # Look for JSON-LD structured data
             scripts = soup.find_all('script', type='application/ld+json')
             for script in scripts:
+                raw = script.string
+                # Cheap prefilter: skip the BreadcrumbList/Organization/WebPage
+                # blocks without paying for a JSON decode
+                if not raw or 'Book' not in raw:
+                    continue
                 try:
-                    if script.string:
-                        data = json.loads(script.string)
-                        if isinstance(data, dict):
-                            if data.get('@type') == 'Book':
-                                if 'publisher' in data:
-                                    pub_info = data['publisher']
-                                    if isinstance(pub_info, dict):
-                                        details['publisher'] = pub_info.get('name', '')
-                                    else:
-                                        details['publisher'] = str(pub_info)
-                                if 'datePublished' in data:
-                                    year_match = re.search(r'\d{4}', data['datePublished'])
-                                    if year_match:
-                                        details['pub_year'] = year_match.group()
-                                if 'isbn' in data:
-                                    details['isbn'] = data['isbn']
-                                if 'bookFormat' in data:
-                                    details['format'] = data['bookFormat']
-                except (json.JSONDecodeError, AttributeError):
+                    # orjson rejects bs4's str subclass; give it bytes
+                    data = _json_loads(raw.encode())
+                    if isinstance(data, dict) and data.get('@type') == 'Book':
+                        if 'publisher' in data:
+                            pub_info = data['publisher']
+                            if isinstance(pub_info, dict):
+                                details['publisher'] = pub_info.get('name', '')
+                            else:
+                                details['publisher'] = str(pub_info)
+                        if 'datePublished' in data:
+                            year_match = _RE_YEAR.search(data['datePublished'])
+                            if year_match:
+                                details['pub_year'] = year_match.group()
+                        if 'isbn' in data:
+                            details['isbn'] = data['isbn']
+                        if 'bookFormat' in data:
+                            details['format'] = data['bookFormat']
+                except (ValueError, AttributeError):  # ValueError covers orjson too
                     continue
 
             # Look for publication info in specific ThriftBooks elements
-            pub_info = soup.find('div', class_=re.compile(r'publication-info'))
+            pub_info = soup.find('div', class_=_RE_PUB_INFO_CLS)
             if pub_info:
                 pub_text = pub_info.get_text()
-                year_match = re.search(r'\b(19|20)\d{2}\b', pub_text)
+                year_match = _RE_YEAR_FULL.search(pub_text)
                 if year_match:
                     details['pub_year'] = year_match.group()
-                pub_match = re.search(r'([^,]+?)(?:,\s*\d{4})', pub_text)
+                pub_match = _RE_PUBLISHER_COMMA.search(pub_text)
                 if pub_match:
                     details['publisher'] = pub_match.group(1).strip()
 
+            self._detail_cache[book_url] = details
             return details
 
         except Exception as e:
@@ -578,10 +741,10 @@ class ThriftBooksBookScraper:
             return "Unknown"
         
         # Remove extra whitespace and newlines
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _RE_WS.sub(' ', text).strip()
         
         # Remove common prefixes
-        text = re.sub(r'^(by\s+)', '', text, flags=re.I)
+        text = _RE_BY_PREFIX.sub('', text)
         
         return text if text else "Unknown"
     
@@ -599,12 +762,22 @@ class ThriftBooksBookScraper:
         if not data:
             logger.warning("No data to save")
             return
-        
+
+        # Lazy import: library users who never save skip the pandas startup cost
+        import pandas as pd
+
         df = pd.DataFrame(data)
         #df["Date_Scraped"] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
         
         try:
-            df.to_excel(filename, index=False)
+            # xlsxwriter streams rows out instead of holding the whole
+            # workbook in memory the way openpyxl does
+            df.to_excel(
+                filename,
+                index=False,
+                engine='xlsxwriter',
+                engine_kwargs={'options': {'constant_memory': True}}
+            )
             logger.info(f"Data saved to {filename}")
             logger.info(f"Total books found: {len(df)}")
             
@@ -626,12 +799,15 @@ class ThriftBooksBookScraper:
         if not data:
             logger.warning("No data to save")
             return
-        
+
+        # Lazy import: library users who never save skip the pandas startup cost
+        import pandas as pd
+
         df = pd.DataFrame(data)
         #df["Date_Scraped"] = pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')
         
         try:
-            df.to_csv(filename, index=False)
+            df.to_csv(filename, index=False, lineterminator='\n')
             logger.info(f"Data saved to {filename}")
         except Exception as e:
             logger.error(f"Error saving to CSV: {str(e)}")